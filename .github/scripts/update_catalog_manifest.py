@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Generate app/catalog.json from the catalog tables built into the installers.
+
+APPS, DESCRIPTIONS and CATEGORIES in app/bua_installer*.py are the source of
+truth; the manifest is never edited by hand. The tables are read from the
+source with ast (the installers import pygame), so this runs on a bare Python.
+"""
+import ast
+import json
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+APP_DIR = REPO_ROOT / "app"
+OUTPUT = APP_DIR / "catalog.json"
+# Installer per architecture, in the order apps and categories are merged
+INSTALLERS = {
+    "x86_64": APP_DIR / "bua_installerx86.py",
+    "arm64": APP_DIR / "bua_installerarm64.py",
+}
+TABLES = ("APPS", "DESCRIPTIONS", "CATEGORIES")
+
+
+def read_tables(path: Path) -> dict:
+    """Run only the statements that build the catalog tables."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    keep = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "bua":
+            keep.append(node)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if any(isinstance(t, ast.Name) and t.id in TABLES + ("BUA_BASE_URL",) for t in targets):
+                keep.append(node)
+        elif (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+              and isinstance(node.value.func, ast.Attribute) and node.value.func.attr == "update"
+              and isinstance(node.value.func.value, ast.Name) and node.value.func.value.id in TABLES):
+            keep.append(node)
+    namespace = {"Dict": Dict, "List": List}
+    exec(compile(ast.Module(body=keep, type_ignores=[]), str(path), "exec"), namespace)
+    return namespace
+
+
+def split_command(cmd: str, prefix: str, suffix: str):
+    """("script", path) for a plain bua() install command, else ("cmd", cmd)"""
+    path = cmd[len(prefix):-len(suffix)]
+    if cmd.startswith(prefix) and cmd.endswith(suffix) and " " not in path:
+        return "script", path
+    return "cmd", cmd
+
+
+def per_arch(values: dict):
+    """One value if every architecture agrees, else an {arch: value} map."""
+    first = next(iter(values.values()))
+    return first if all(v == first for v in values.values()) else values
+
+
+def build_manifest() -> dict:
+    tables = {arch: read_tables(path) for arch, path in INSTALLERS.items()}
+    names: List[str] = []
+    for table in tables.values():
+        names += [name for name in table["APPS"] if name not in names]
+
+    apps = {}
+    for name in names:
+        present = {arch: table for arch, table in tables.items() if name in table["APPS"]}
+        commands = {
+            arch: split_command(table["APPS"][name], f"curl -L {table['BUA_BASE_URL']}/", " | bash")
+            for arch, table in present.items()
+        }
+        kinds = {kind for kind, _ in commands.values()}
+        if len(kinds) != 1:
+            raise SystemExit(f"{name}: installed by a script on some architectures and a command on others")
+        kind = kinds.pop()
+        entry = {kind: per_arch({arch: value for arch, (_, value) in commands.items()})}
+        description = per_arch({arch: table["DESCRIPTIONS"].get(name, "") for arch, table in present.items()})
+        if description:
+            entry["description"] = description
+        if len(present) < len(tables):
+            entry["arch"] = list(present)
+        apps[name] = entry
+
+    return {
+        "version": 1,
+        "categories": {arch: table["CATEGORIES"] for arch, table in tables.items()},
+        "apps": apps,
+    }
+
+
+def render(manifest: dict) -> str:
+    """JSON with one line per app and per category, so diffs stay readable."""
+    def dump(value) -> str:
+        return json.dumps(value, ensure_ascii=False)
+
+    lines = ["{", f'  "version": {manifest["version"]},', '  "categories": {']
+    archs = list(manifest["categories"].items())
+    for i, (arch, categories) in enumerate(archs):
+        lines.append(f"    {dump(arch)}: {{")
+        items = list(categories.items())
+        for j, (cat_name, app_list) in enumerate(items):
+            lines.append(f"      {dump(cat_name)}: {dump(app_list)}" + ("," if j < len(items) - 1 else ""))
+        lines.append("    }" + ("," if i < len(archs) - 1 else ""))
+    lines += ["  },", '  "apps": {']
+    apps = list(manifest["apps"].items())
+    for i, (name, entry) in enumerate(apps):
+        lines.append(f"    {dump(name)}: {dump(entry)}" + ("," if i < len(apps) - 1 else ""))
+    lines += ["  }", "}"]
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    text = render(build_manifest())
+
+    if OUTPUT.exists():
+        old = OUTPUT.read_text(encoding="utf-8")
+        if old == text:
+            print("catalog.json is already up to date")
+            return
+
+    OUTPUT.write_text(text, encoding="utf-8")
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
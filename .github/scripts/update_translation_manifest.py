@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TRANSLATION_DIR = REPO_ROOT / "app" / "translation"
+OUTPUT = TRANSLATION_DIR / "manifest.json"
+
+
+def main() -> None:
+    languages = {}
+    for path in sorted(TRANSLATION_DIR.glob("*.json")):
+        if path == OUTPUT:
+            continue
+        raw = path.read_bytes()
+        data = json.loads(raw.decode("utf-8"))
+        languages[path.stem] = {
+            "keys": len(data),
+            # sha1 of the raw file bytes, compared against the installer's cache index
+            "sha1": hashlib.sha1(raw).hexdigest(),
+        }
+
+    text = json.dumps({"version": 1, "languages": languages}, indent=2, sort_keys=True) + "\n"
+
+    if OUTPUT.exists():
+        old = OUTPUT.read_text(encoding="utf-8")
+        if old == text:
+            print("manifest.json is already up to date")
+            return
+
+    OUTPUT.write_text(text, encoding="utf-8")
+    print(f"Wrote {OUTPUT}")
+
+
+if __name__ == "__main__":
+    main()
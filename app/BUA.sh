@@ -1,3 +1,64 @@
 #!/bin/bash
 export DISPLAY=:0.0
-curl -Ls https://raw.githubusercontent.com/batocera-unofficial-addons/batocera-unofficial-addons/main/app/bua_installerx86.py | python3
+
+INSTALLER_URL="https://raw.githubusercontent.com/batocera-unofficial-addons/batocera-unofficial-addons/main/app/bua_installerx86.py"
+INSTALLER_NAME="bua_installerx86"
+
+# Launcher mode: "cached" (default) keeps a local copy of the installer and
+# revalidates it in the background, "stream" pipes it straight into python3.
+LAUNCH_MODE="${BUA_LAUNCH_MODE:-cached}"
+
+CACHE_DIR="/userdata/system/add-ons/bua"
+CACHE_FILE="$CACHE_DIR/$INSTALLER_NAME.py"
+NEXT_FILE="$CACHE_FILE.next"
+ETAG_FILE="$CACHE_FILE.etag"
+
+if [ "$LAUNCH_MODE" = "stream" ]; then
+    curl -Ls "$INSTALLER_URL" | python3
+    exit $?
+fi
+
+mkdir -p "$CACHE_DIR"
+
+# Compiled bytecode persists here so warm starts skip parsing the installer
+export PYTHONPYCACHEPREFIX="$CACHE_DIR/pycache"
+
+# Fetch the installer only if it changed (ETag / Last-Modified), validate it
+# and stage it next to the cache. Never touches the copy that is running.
+refresh_installer() {
+    local tmp="$CACHE_FILE.tmp.$$"
+    local code
+    local args=(-Ls --connect-timeout 5 --max-time 60 -o "$tmp" -w '%{http_code}' --etag-save "$ETAG_FILE.tmp.$$")
+    if [ -s "$CACHE_FILE" ]; then
+        [ -s "$ETAG_FILE" ] && args+=(--etag-compare "$ETAG_FILE")
+        args+=(-z "$CACHE_FILE")
+    fi
+    code=$(curl "${args[@]}" "$INSTALLER_URL" 2>/dev/null)
+    if [ "$code" = "200" ] && [ -s "$tmp" ] && \
+       python3 -c 'import sys; compile(open(sys.argv[1], "rb").read(), sys.argv[1], "exec")' "$tmp" 2>/dev/null; then
+        mv -f "$tmp" "$1"
+        [ -s "$ETAG_FILE.tmp.$$" ] && mv -f "$ETAG_FILE.tmp.$$" "$ETAG_FILE"
+    fi
+    rm -f "$tmp" "$ETAG_FILE.tmp.$$"
+}
+
+# Swap in a version staged by the previous launch (rename is atomic)
+if [ -s "$NEXT_FILE" ]; then
+    mv -f "$NEXT_FILE" "$CACHE_FILE"
+fi
+
+if [ -s "$CACHE_FILE" ]; then
+    # Warm start: run the cached copy now, revalidate for the next launch
+    ( refresh_installer "$NEXT_FILE" ) >/dev/null 2>&1 &
+else
+    # Cold start: nothing cached yet, fetch in the foreground
+    refresh_installer "$CACHE_FILE"
+    if [ ! -s "$CACHE_FILE" ]; then
+        curl -Ls "$INSTALLER_URL" | python3
+        exit $?
+    fi
+fi
+
+# Run as a module so the bytecode cache is used for the installer itself
+export PYTHONPATH="$CACHE_DIR${PYTHONPATH:+:$PYTHONPATH}"
+exec python3 -m "$INSTALLER_NAME"
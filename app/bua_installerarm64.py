@@ -3,6 +3,29 @@
 
 import os
 import sys
+import time
+
+_PROCESS_STARTED = time.perf_counter()
+
+# BUA_IMPORT_PROFILE=1 records the cost of every first-time import so slow
+# dependencies show up in the log (see report_import_profile()).
+_IMPORT_TIMES: dict = {}
+if os.environ.get("BUA_IMPORT_PROFILE"):
+    import builtins
+
+    _real_import = builtins.__import__
+
+    def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return _real_import(name, globals, locals, fromlist, level)
+        started = time.perf_counter()
+        try:
+            return _real_import(name, globals, locals, fromlist, level)
+        finally:
+            _IMPORT_TIMES.setdefault(name, time.perf_counter() - started)
+
+    builtins.__import__ = _timed_import
+
 import threading
 import subprocess
 import pygame
@@ -10,13 +33,108 @@ import json
 import base64
 import io
 import re
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from urllib.parse import urlparse
-import urllib.request
-import urllib.parse
-import time
 from typing import Dict, List, Tuple
 import hashlib
+import bisect
+import unicodedata
+
+# Heavy or rarely needed modules (urllib, cv2, shlex, traceback, tempfile)
+# are imported inside the functions that use them.
+
+# ------------------------------
+# Startup tracing
+# ------------------------------
+# BUA_TRACE=/path/to/trace.json records a timeline of startup work and writes
+# it in Chrome trace format (open in chrome://tracing or ui.perfetto.dev).
+TRACE_FILE = os.environ.get("BUA_TRACE", "").strip()
+_TRACE_EVENTS: List[dict] = []
+_TRACE_THREADS: Dict[int, str] = {}
+_TRACE_LOCK = threading.Lock()
+
+def _trace_us(t: float) -> int:
+    return int((t - _PROCESS_STARTED) * 1_000_000)
+
+class trace_span:
+    """Context manager recording a complete ("X") trace event while BUA_TRACE is set."""
+    __slots__ = ("name", "cat", "args", "started")
+
+    def __init__(self, name: str, cat: str = "startup", **args):
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.started = 0.0
+
+    def __enter__(self):
+        if TRACE_FILE:
+            self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if not TRACE_FILE:
+            return False
+        ended = time.perf_counter()
+        thread = threading.current_thread()
+        event = {
+            "name": self.name, "cat": self.cat, "ph": "X",
+            "ts": _trace_us(self.started), "dur": int((ended - self.started) * 1_000_000),
+            "pid": os.getpid(), "tid": thread.ident,
+        }
+        if exc_type is not None:
+            self.args["error"] = f"{exc_type.__name__}: {exc}"
+        if self.args:
+            event["args"] = {k: str(v) for k, v in self.args.items()}
+        with _TRACE_LOCK:
+            _TRACE_EVENTS.append(event)
+            _TRACE_THREADS.setdefault(thread.ident, thread.name)
+        return False
+
+def traced(name: str, cat: str = "startup"):
+    """Decorator form of trace_span."""
+    def wrap(func):
+        def inner(*a, **kw):
+            with trace_span(name, cat):
+                return func(*a, **kw)
+        inner.__name__ = func.__name__
+        inner.__doc__ = func.__doc__
+        return inner
+    return wrap
+
+def trace_instant(name: str, cat: str = "startup"):
+    """Record a point-in-time marker (e.g. first frame, ready)."""
+    if not TRACE_FILE:
+        return
+    thread = threading.current_thread()
+    with _TRACE_LOCK:
+        _TRACE_EVENTS.append({
+            "name": name, "cat": cat, "ph": "i", "s": "p",
+            "ts": _trace_us(time.perf_counter()), "pid": os.getpid(), "tid": thread.ident,
+        })
+        _TRACE_THREADS.setdefault(thread.ident, thread.name)
+
+def write_trace():
+    """Write everything recorded so far to BUA_TRACE (safe to call repeatedly)."""
+    if not TRACE_FILE:
+        return
+    pid = os.getpid()
+    with _TRACE_LOCK:
+        events = list(_TRACE_EVENTS)
+        threads = dict(_TRACE_THREADS)
+    meta = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": "BUA"}}]
+    meta += [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": tname}}
+             for tid, tname in threads.items()]
+    try:
+        d = os.path.dirname(TRACE_FILE)
+        if d:
+            os.makedirs(d, exist_ok=True)
+        tmp = TRACE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, TRACE_FILE)
+        print(f"[BUA] Wrote {len(events)} trace events to {TRACE_FILE}")
+    except Exception as e:
+        print(f"[BUA] Could not write trace: {e}")
 
 # ------------------------------
 # Changelog
@@ -45,7 +163,95 @@ Added RunImage Desktop, NZP, RGSX, and Raspberry Pi Imager.
 # ------------------------------
 # This code runs on EVERY launch before the main app loads.
 # Use this for one-time setup tasks, migrations, or live fixes.
-# Keep it lightweight - heavy operations will slow down app startup.
+# Tasks are scheduled as background startup phases so they never hold up the
+# splash screen. Anything that needs the user's attention should call
+# queue_startup_notice() instead of drawing its own modal.
+
+class StartupPhase:
+    """A background startup task.
+
+    priority: lower values run first (phases run one after another)
+    deadline: seconds to wait before the next phase starts anyway
+    after: name of a phase that must have finished first, however long it takes
+    critical: start during startup; other phases are held back until the main
+    menu is ready so they stay out of the cold-start budget
+    """
+    def __init__(self, name: str, func, priority: int = 50, deadline: float = 10.0, after: str | None = None,
+                 critical: bool = False):
+        self.name = name
+        self.func = func
+        self.priority = priority
+        self.deadline = deadline
+        self.after = after
+        self.critical = critical
+        self.duration: float | None = None
+        self.error: str | None = None
+        self.done = threading.Event()
+
+STARTUP_PHASES: List[StartupPhase] = []
+# Set once the main menu can be shown; non-critical phases wait for it
+STARTUP_READY = threading.Event()
+# (title, lines) messages shown as dialogs once the main menu is up
+STARTUP_NOTICES: List[Tuple[str, List[str]]] = []
+_STARTUP_NOTICES_LOCK = threading.Lock()
+
+# Held while a job changes what is installed: an add-on install/uninstall (see
+# Runner.run) or BUA reinstalling itself during startup. Only one runs at a time.
+INSTALL_LOCK = threading.Lock()
+
+def schedule_startup_phase(name: str, func, priority: int = 50, deadline: float = 10.0, after: str | None = None,
+                           critical: bool = False):
+    """Register a task to run in the background during startup"""
+    STARTUP_PHASES.append(StartupPhase(name, func, priority, deadline, after, critical))
+
+def queue_startup_notice(title: str, lines: List[str]):
+    """Queue a message for the user; shown as soon as the UI is ready"""
+    with _STARTUP_NOTICES_LOCK:
+        STARTUP_NOTICES.append((title, list(lines)))
+
+def take_startup_notices() -> List[Tuple[str, List[str]]]:
+    """Return and clear all pending startup notices"""
+    with _STARTUP_NOTICES_LOCK:
+        notices = list(STARTUP_NOTICES)
+        STARTUP_NOTICES.clear()
+    return notices
+
+def _run_startup_phase(phase: StartupPhase):
+    for other in STARTUP_PHASES:
+        if other.name == phase.after:
+            other.done.wait()
+    started = time.monotonic()
+    try:
+        with trace_span(phase.name, "live_update"):
+            phase.func()
+    except Exception as e:
+        phase.error = str(e)
+        print(f"[BUA] Startup phase '{phase.name}' error: {e}")
+    finally:
+        phase.duration = time.monotonic() - started
+        status = "failed" if phase.error else "finished"
+        print(f"[BUA] Startup phase '{phase.name}' {status} in {phase.duration * 1000:.0f} ms")
+        phase.done.set()
+
+def _start_startup_phases(phases: List[StartupPhase]):
+    for phase in sorted(phases, key=lambda p: p.priority):
+        threading.Thread(target=_run_startup_phase, args=(phase,), name=f"bua-phase-{phase.name}", daemon=True).start()
+        if not phase.done.wait(phase.deadline):
+            print(f"[BUA] Startup phase '{phase.name}' missed its {phase.deadline:.0f}s deadline, continuing in background")
+
+def _startup_scheduler():
+    started = time.monotonic()
+    _start_startup_phases([p for p in STARTUP_PHASES if p.critical])
+    deferred = [p for p in STARTUP_PHASES if not p.critical]
+    if deferred:
+        with trace_span("deferred_phases_wait"):
+            STARTUP_READY.wait()
+        _start_startup_phases(deferred)
+    print(f"[BUA] Startup phases scheduled in {(time.monotonic() - started) * 1000:.0f} ms")
+
+def run_startup_phases():
+    """Start the startup scheduler; returns immediately"""
+    threading.Thread(target=_startup_scheduler, name="bua-startup", daemon=True).start()
 
 def live_update_block():
     """
@@ -57,20 +263,103 @@ def live_update_block():
     - Update configuration files
     - Check/install dependencies
 
-    IMPORTANT: Keep this fast! It runs on EVERY launch.
+    Tasks run in the background, so keep their deadlines realistic. Only
+    phases marked critical start before the main menu is ready.
     """
     try:
-        # Example: Setup custom_service_handler
-        setup_custom_service_handler()
+        schedule_startup_phase("custom_service_handler", setup_custom_service_handler, priority=10, deadline=15)
 
         # Add more live update tasks here as needed
         # Example:
-        # fix_legacy_configs()
-        # update_system_files()
+        # schedule_startup_phase("legacy_configs", fix_legacy_configs, priority=40)
+        run_startup_phases()
 
     except Exception as e:
         print(f"[BUA] Live update block error: {e}")
 
+# ------------------------------
+# Warm-start snapshot
+# ------------------------------
+# State derived at startup (the resolved language and the versions of its
+# translation shards, menu stats) is written to one file on clean exit. Each section records the mtime/size of the files it was
+# derived from, plus a key for state kept in the database, and is only reused
+# while both are unchanged; anything stale is simply recomputed the normal way.
+SNAPSHOT_FILE = "/userdata/system/add-ons/bua_snapshot.json"
+SNAPSHOT_VERSION = 1
+
+_SNAPSHOT_LOADED: Dict[str, dict] = {}   # sections read from disk, not yet used
+_SNAPSHOT_PENDING: Dict[str, dict] = {}  # sections to write at exit
+_SNAPSHOT_LOCK = threading.Lock()
+
+def snapshot_inputs(paths: List[str]) -> Dict[str, list]:
+    """Stamp input files as {path: [mtime_ns, size]} ([] when missing)."""
+    stamps = {}
+    for p in paths:
+        try:
+            st = os.stat(p)
+            stamps[p] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamps[p] = []
+    return stamps
+
+def _snapshot_valid(section: dict, key: str) -> bool:
+    if section.get("key", "") != key:
+        return False
+    deps = section.get("deps") or {}
+    return snapshot_inputs(list(deps)) == deps
+
+@traced("load_startup_snapshot")
+def load_startup_snapshot():
+    """Read the snapshot written by the previous clean exit into memory."""
+    try:
+        with open(SNAPSHOT_FILE, "rb") as f:
+            data = json.loads(f.read())
+        if data.get("version") != SNAPSHOT_VERSION:
+            return
+        with _SNAPSHOT_LOCK:
+            _SNAPSHOT_LOADED.update(data.get("sections") or {})
+        print(f"[BUA] Loaded warm-start snapshot ({', '.join(sorted(_SNAPSHOT_LOADED)) or 'empty'})")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[BUA] Ignoring warm-start snapshot: {e}")
+
+def take_snapshot_section(name: str, key: str = ""):
+    """Return a snapshot section's data if its inputs are unchanged, else None.
+    Each section is handed out once; later calls recompute."""
+    with _SNAPSHOT_LOCK:
+        section = _SNAPSHOT_LOADED.pop(name, None)
+    if section is None:
+        return None
+    if not _snapshot_valid(section, key):
+        print(f"[BUA] Warm-start snapshot: '{name}' is stale, recomputing")
+        return None
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT_PENDING.setdefault(name, section)
+    return section.get("data")
+
+def remember_snapshot_section(name: str, data, inputs: Dict[str, list], key: str = ""):
+    """Keep freshly computed state for the next launch. Take `inputs` with
+    snapshot_inputs() before reading the files so concurrent edits invalidate it."""
+    with _SNAPSHOT_LOCK:
+        _SNAPSHOT_PENDING[name] = {"deps": inputs, "key": key, "data": data}
+
+def save_startup_snapshot():
+    """Write the snapshot (called on clean exit)."""
+    with _SNAPSHOT_LOCK:
+        sections = dict(_SNAPSHOT_LOADED)  # never used this session, still candidates
+        sections.update(_SNAPSHOT_PENDING)
+    sections = {name: s for name, s in sections.items() if _snapshot_valid(s, s.get("key", ""))}
+    try:
+        os.makedirs(os.path.dirname(SNAPSHOT_FILE), exist_ok=True)
+        tmp = SNAPSHOT_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"version": SNAPSHOT_VERSION, "sections": sections}, f, ensure_ascii=False)
+        os.replace(tmp, SNAPSHOT_FILE)
+        print(f"[BUA] Saved warm-start snapshot ({', '.join(sorted(sections)) or 'empty'})")
+    except Exception as e:
+        print(f"[BUA] Could not save warm-start snapshot: {e}")
+
 # ------------------------------
 # Translation System
 # ------------------------------
@@ -82,7 +371,11 @@ LANGUAGE_FILE = "/userdata/system/add-ons/bua_language.txt"
 RESOLUTION_FILE = "/userdata/system/add-ons/bua_resolution.txt"
 CARDS_PER_PAGE_FILE = "/userdata/system/add-ons/bua_cards_per_page.txt"
 CHANGELOG_HASH_FILE = "/userdata/system/add-ons/bua_changelog_hash.txt"
-TRANSLATION_CACHE_FILE = "/userdata/system/add-ons/bua_translation_cache.json"
+CONTROLS_FILE = "/userdata/system/add-ons/bua_controls.json"  # manual button map
+TRANSLATION_CACHE_FILE = "/userdata/system/add-ons/bua_translation_cache.json"  # legacy, migrated to shards
+TRANSLATION_CACHE_DIR = "/userdata/system/add-ons/bua_translations"  # one <code>.json per language
+TRANSLATION_CACHE_INDEX = os.path.join(TRANSLATION_CACHE_DIR, "index.json")
+BATOCERA_CONF = "/userdata/system/batocera.conf"
 SPLASH_CACHE_FILE = "/userdata/system/add-ons/bua_splash.mp4"
 
 # Default and current cards per page setting
@@ -106,14 +399,115 @@ TRANSLATION_DIRS = [
 # GitHub URL for translations
 TRANSLATION_BASE_URL = "https://raw.githubusercontent.com/batocera-unofficial-addons/batocera-unofficial-addons/main/app/translation"
 
+# ------------------------------
+# Network state
+# ------------------------------
+# One quick TCP probe decides whether the session is online. While offline
+# every fetch fails immediately so startup is served from the local caches,
+# and during startup all fetches share a single time budget instead of each
+# paying its own timeout and retries. BUA_OFFLINE=1 forces offline mode.
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except Exception:
+        return default
+
+NETWORK_PROBE_ADDR = ("raw.githubusercontent.com", 443)
+NETWORK_PROBE_TIMEOUT = _env_float("BUA_NET_PROBE_TIMEOUT", 1.5)
+NETWORK_REPROBE_INTERVAL = 30.0  # offline sessions re-check this often after startup
+STARTUP_NETWORK_BUDGET = _env_float("BUA_NET_BUDGET", 8.0)  # seconds, shared by all startup fetches
+
+class OfflineError(OSError):
+    """Raised instead of attempting a fetch while offline or out of startup budget."""
+
+_NETWORK_ONLINE: bool | None = None  # None until the probe has finished
+_NETWORK_PROBED = threading.Event()
+_NETWORK_PROBE_LOCK = threading.Lock()
+_NETWORK_PROBE_STARTED = False
+_NETWORK_REPROBING = False
+_NETWORK_LAST_PROBE = 0.0
+_NETWORK_DEADLINE: float | None = None
+
+def _probe_network():
+    global _NETWORK_ONLINE, _NETWORK_LAST_PROBE
+    import socket
+    if os.environ.get("BUA_OFFLINE", "").strip().lower() in ("1", "true", "yes"):
+        online = False
+    else:
+        with trace_span("network_probe", "network"):
+            try:
+                socket.create_connection(NETWORK_PROBE_ADDR, timeout=NETWORK_PROBE_TIMEOUT).close()
+                online = True
+            except OSError:
+                online = False
+    if online != _NETWORK_ONLINE:
+        print(f"[BUA] Network {'online' if online else 'unreachable, using offline mode'}")
+    _NETWORK_ONLINE = online
+    _NETWORK_LAST_PROBE = time.monotonic()
+    _NETWORK_PROBED.set()
+
+def start_network_probe():
+    """Probe reachability in the background; fetches wait for the result."""
+    global _NETWORK_PROBE_STARTED
+    with _NETWORK_PROBE_LOCK:
+        if _NETWORK_PROBE_STARTED:
+            return
+        _NETWORK_PROBE_STARTED = True
+    threading.Thread(target=_probe_network, name="bua-net-probe", daemon=True).start()
+
+def _reprobe_network():
+    global _NETWORK_REPROBING
+    try:
+        _probe_network()
+    finally:
+        _NETWORK_REPROBING = False
+
+def network_available() -> bool:
+    """True when the probe found the network. Only the first call waits for the
+    probe; an offline session is re-probed in the background now and then, and
+    the cached state is returned meanwhile (this is called from the UI thread)."""
+    global _NETWORK_REPROBING
+    start_network_probe()
+    _NETWORK_PROBED.wait(NETWORK_PROBE_TIMEOUT + 1.0)
+    if (_NETWORK_ONLINE is False and _NETWORK_DEADLINE is None
+            and time.monotonic() - _NETWORK_LAST_PROBE >= NETWORK_REPROBE_INTERVAL):
+        with _NETWORK_PROBE_LOCK:
+            if not _NETWORK_REPROBING:
+                _NETWORK_REPROBING = True
+                threading.Thread(target=_reprobe_network, name="bua-net-reprobe", daemon=True).start()
+    return bool(_NETWORK_ONLINE)
+
+def begin_startup_network_budget(budget: float = STARTUP_NETWORK_BUDGET):
+    global _NETWORK_DEADLINE
+    _NETWORK_DEADLINE = time.monotonic() + budget
+
+def end_startup_network_budget():
+    global _NETWORK_DEADLINE
+    _NETWORK_DEADLINE = None
+
+def network_timeout(timeout: float) -> float:
+    """Timeout to use for the next request, capped by the startup budget.
+    Raises OfflineError when the request should not be attempted at all."""
+    if not network_available():
+        raise OfflineError("offline")
+    deadline = _NETWORK_DEADLINE
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0.05:
+        raise OfflineError("startup network budget exhausted")
+    return min(timeout, remaining)
+
 def fetch_url_with_retry(url: str, headers: dict, timeout: int = 5, retries: int = 2) -> bytes:
     """
     Fetch URL with exponential backoff retry logic.
     Returns the response bytes or raises an exception after all retries fail.
     Set retries=0 for a single attempt with no error logging (useful for silent fallbacks).
+    Raises OfflineError straight away when offline or out of startup network budget.
     """
-    import time
     import urllib.error
+    import urllib.request
     last_error = None
     silent_mode = (retries == 0)  # Silent mode when no retries requested
 
@@ -121,12 +515,17 @@ def fetch_url_with_retry(url: str, headers: dict, timeout: int = 5, retries: int
         try:
             if attempt > 0:
                 wait_time = (2 ** attempt)  # Exponential backoff: 2s, 4s
+                # Don't sleep past the startup budget just to be refused afterwards
+                if network_timeout(timeout) <= wait_time and _NETWORK_DEADLINE is not None:
+                    break
                 print(f"[BUA] Retry {attempt}/{retries} after {wait_time}s...")
                 time.sleep(wait_time)
 
             req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=timeout) as response:
+            with urllib.request.urlopen(req, timeout=network_timeout(timeout)) as response:
                 return response.read()
+        except OfflineError:
+            raise
         except urllib.error.HTTPError as e:
             last_error = e
             if attempt < retries and not silent_mode:
@@ -148,35 +547,140 @@ def fetch_url_with_retry(url: str, headers: dict, timeout: int = 5, retries: int
         print(f"[BUA] Failed to fetch after {retries + 1} attempts: {url}")
     raise last_error
 
-def load_translation_cache() -> Dict[str, Dict[str, str]]:
-    """Load all cached translations from disk"""
+def fetch_url_conditional(url: str, headers: dict, etag: str | None = None,
+                          last_modified: str | None = None, timeout: int = 5) -> Tuple[int, bytes | None, Dict[str, str]]:
+    """
+    Single conditional GET (If-None-Match / If-Modified-Since).
+    Returns (status, body, validators) where status is 200, 304 or the HTTP error code.
+    validators holds the 'etag' and 'last_modified' response headers when present.
+    Network errors are raised to the caller.
+    """
+    import urllib.error
+    import urllib.request
+    req_headers = dict(headers)
+    if etag:
+        req_headers["If-None-Match"] = etag
+    if last_modified:
+        req_headers["If-Modified-Since"] = last_modified
+    req = urllib.request.Request(url, headers=req_headers)
     try:
-        if os.path.exists(TRANSLATION_CACHE_FILE):
-            with open(TRANSLATION_CACHE_FILE, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
-                print(f"[BUA] Loaded translation cache with {len(cache)} languages")
-                return cache
-    except Exception as e:
-        print(f"[BUA] Could not load translation cache: {e}")
-    return {}
-
-def save_translation_cache(cache: Dict[str, Dict[str, str]]):
-    """Save all translations to disk cache"""
+        with urllib.request.urlopen(req, timeout=network_timeout(timeout)) as response:
+            validators = {
+                "etag": response.headers.get("ETag") or "",
+                "last_modified": response.headers.get("Last-Modified") or "",
+            }
+            return response.status, response.read(), validators
+    except urllib.error.HTTPError as e:
+        return e.code, None, {}
+
+def _atomic_write_json(path: str, data, fsync: bool = False, **dump_kwargs):
+    """Write JSON to path via a temp file + rename so readers never see a partial file.
+    With fsync=True the data is on disk before the rename, so it also survives a power cut."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp.{os.getpid()}.{threading.get_ident()}"
     try:
-        os.makedirs(os.path.dirname(TRANSLATION_CACHE_FILE), exist_ok=True)
-        with open(TRANSLATION_CACHE_FILE, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, ensure_ascii=False)
-        print(f"[BUA] Saved translation cache with {len(cache)} languages")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+# Translation cache: one shard per language plus a small index
+# ({code: {keys, sha1, etag, last_modified, fetched}}). Shards are read only
+# when that language is needed and kept in memory afterwards.
+_TRANSLATION_SHARDS: Dict[str, Dict[str, str]] = {}
+_TRANSLATION_INDEX: Dict[str, dict] | None = None
+_TRANSLATION_CACHE_LOCK = threading.RLock()
+
+def _translation_shard_path(lang_code: str) -> str:
+    safe = re.sub(r"[^A-Za-z0-9_-]", "", lang_code)
+    return os.path.join(TRANSLATION_CACHE_DIR, f"{safe}.json")
+
+def _migrate_legacy_translation_cache(index: Dict[str, dict]):
+    """Split the old single-file cache into shards (once)."""
+    try:
+        with open(TRANSLATION_CACHE_FILE, "r", encoding="utf-8") as f:
+            legacy = json.load(f)
+        for code, data in legacy.items():
+            if isinstance(data, dict) and data and code not in index:
+                raw = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                _atomic_write_json(_translation_shard_path(code), data, ensure_ascii=False)
+                index[code] = {"keys": len(data), "sha1": hashlib.sha1(raw).hexdigest(),
+                               "etag": "", "last_modified": "", "fetched": 0}
+        _atomic_write_json(TRANSLATION_CACHE_INDEX, index)
+        os.remove(TRANSLATION_CACHE_FILE)
+        print(f"[BUA] Migrated translation cache to {len(index)} shards")
     except Exception as e:
-        print(f"[BUA] Could not save translation cache: {e}")
+        print(f"[BUA] Could not migrate translation cache: {e}")
+
+def translation_cache_index() -> Dict[str, dict]:
+    """Index of cached languages (loaded once per process)."""
+    global _TRANSLATION_INDEX
+    with _TRANSLATION_CACHE_LOCK:
+        if _TRANSLATION_INDEX is None:
+            index = {}
+            try:
+                with open(TRANSLATION_CACHE_INDEX, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    index = data
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"[BUA] Could not load translation cache index: {e}")
+            if os.path.exists(TRANSLATION_CACHE_FILE):
+                _migrate_legacy_translation_cache(index)
+            _TRANSLATION_INDEX = index
+        return _TRANSLATION_INDEX
+
+def load_cached_translation(lang_code: str) -> Dict[str, str] | None:
+    """Cached table for one language, or None if it was never downloaded."""
+    with _TRANSLATION_CACHE_LOCK:
+        if lang_code in _TRANSLATION_SHARDS:
+            return _TRANSLATION_SHARDS[lang_code]
+        if lang_code not in translation_cache_index():
+            return None
+        try:
+            with open(_translation_shard_path(lang_code), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[BUA] Could not read cached translation {lang_code}: {e}")
+            return None
+        _TRANSLATION_SHARDS[lang_code] = data
+        return data
 
+def save_cached_translation(lang_code: str, data: Dict[str, str], raw: bytes, validators: Dict[str, str] | None = None):
+    """Write one language shard and its index entry."""
+    validators = validators or {}
+    with _TRANSLATION_CACHE_LOCK:
+        _TRANSLATION_SHARDS[lang_code] = data
+        index = translation_cache_index()
+        try:
+            _atomic_write_json(_translation_shard_path(lang_code), data, ensure_ascii=False)
+            index[lang_code] = {
+                "keys": len(data),
+                "sha1": hashlib.sha1(raw).hexdigest(),
+                "etag": validators.get("etag", ""),
+                "last_modified": validators.get("last_modified", ""),
+                "fetched": time.time(),
+            }
+            _atomic_write_json(TRANSLATION_CACHE_INDEX, index)
+        except Exception as e:
+            print(f"[BUA] Could not save translation cache for {lang_code}: {e}")
+
+@traced("load_translation_file", "i18n")
 def load_translation_file(lang_code: str) -> Dict[str, str]:
     """Load a translation JSON file from cache or GitHub with retry logic"""
-    # First, check disk cache
-    cache = load_translation_cache()
-    if lang_code in cache:
-        print(f"[BUA] Using cached translation for {lang_code} ({len(cache[lang_code])} keys)")
-        return cache[lang_code]
+    # First, check disk cache (served as is, refreshed in the background)
+    cached = load_cached_translation(lang_code)
+    if cached is not None:
+        print(f"[BUA] Using cached translation for {lang_code} ({len(cached)} keys)")
+        schedule_translation_revalidation(lang_code)
+        return cached
 
     # Not in cache, try downloading from GitHub
     try:
@@ -194,8 +698,7 @@ def load_translation_file(lang_code: str) -> Dict[str, str]:
         print(f"[BUA] Successfully downloaded translation {lang_code} ({len(data)} keys)")
 
         # Save to cache
-        cache[lang_code] = data
-        save_translation_cache(cache)
+        save_cached_translation(lang_code, data, data_bytes)
 
         return data
     except Exception as e:
@@ -203,103 +706,195 @@ def load_translation_file(lang_code: str) -> Dict[str, str]:
         print(f"[BUA] Continuing with empty translation (English fallback)")
         return {}
 
-def get_batocera_language() -> str:
-    """Read system language from batocera.conf"""
-    batocera_conf = "/userdata/system/batocera.conf"
-    if os.path.exists(batocera_conf):
+# ---------- Translation revalidation (stale-while-revalidate) ----------
+# Cached tables are used immediately; a background worker re-checks them with
+# If-None-Match and queues changed tables, which the UI loop swaps in on its
+# next frame via apply_pending_translations().
+TRANSLATION_REVALIDATE_AGE = 6 * 3600  # re-check a cached language at most this often
+
+_REVALIDATE_QUEUE: List[str] = []
+_REVALIDATE_SCHEDULED: set = set()
+_REVALIDATE_COND = threading.Condition()
+_REVALIDATE_WORKER_STARTED = False
+_PENDING_TRANSLATIONS: Dict[str, Dict[str, str]] = {}
+_PENDING_TRANSLATIONS_LOCK = threading.Lock()
+
+def schedule_translation_revalidation(lang_code: str, force: bool = False):
+    """Queue a background freshness check for a cached language."""
+    global _REVALIDATE_WORKER_STARTED
+    entry = translation_cache_index().get(lang_code, {})
+    recently_checked = time.time() - entry.get("checked", entry.get("fetched", 0)) < TRANSLATION_REVALIDATE_AGE
+    if recently_checked and not force and lang_code not in stale_cached_translations():
+        return
+    with _REVALIDATE_COND:
+        if lang_code in _REVALIDATE_SCHEDULED:
+            return
+        _REVALIDATE_SCHEDULED.add(lang_code)
+        _REVALIDATE_QUEUE.append(lang_code)
+        _REVALIDATE_COND.notify()
+        if not _REVALIDATE_WORKER_STARTED:
+            _REVALIDATE_WORKER_STARTED = True
+            threading.Thread(target=_translation_revalidate_worker, name="bua-i18n-revalidate", daemon=True).start()
+
+def _translation_revalidate_worker():
+    while True:
+        with _REVALIDATE_COND:
+            while not _REVALIDATE_QUEUE:
+                _REVALIDATE_COND.wait()
+            lang_code = _REVALIDATE_QUEUE.pop(0)
         try:
-            with open(batocera_conf, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('system.language='):
-                        # Extract language code (e.g., "en_US" -> "en")
-                        lang_value = line.split('=', 1)[1].strip()
-                        # Map batocera locale codes to our language codes
-                        if lang_value.startswith('en_'):
-                            return 'en'
-                        elif lang_value.startswith('es_'):
-                            return 'es'
-                        elif lang_value.startswith('fr_'):
-                            return 'fr'
-                        elif lang_value.startswith('de_'):
-                            return 'de'
-                        elif lang_value.startswith('it_'):
-                            return 'it'
-                        elif lang_value.startswith('pt_BR'):
-                            return 'pt_BR'
-                        elif lang_value.startswith('pt_'):
-                            return 'pt'
-                        elif lang_value.startswith('ru_'):
-                            return 'ru'
-                        elif lang_value.startswith('ja_'):
-                            return 'ja'
-                        elif lang_value.startswith('zh_CN'):
-                            return 'zh'
-                        elif lang_value.startswith('zh_TW'):
-                            return 'zh_TW'
-                        elif lang_value.startswith('ko_'):
-                            return 'ko'
-                        elif lang_value.startswith('ar_'):
-                            return 'ar'
-                        elif lang_value.startswith('nl_'):
-                            return 'nl'
-                        elif lang_value.startswith('pl_'):
-                            return 'pl'
-                        elif lang_value.startswith('tr_'):
-                            return 'tr'
-                        elif lang_value.startswith('vi_'):
-                            return 'vi'
-                        elif lang_value.startswith('th_'):
-                            return 'th'
-                        elif lang_value.startswith('sv_'):
-                            return 'sv'
-                        elif lang_value.startswith('no_'):
-                            return 'no'
-                        elif lang_value.startswith('da_'):
-                            return 'da'
-                        elif lang_value.startswith('fi_'):
-                            return 'fi'
-                        elif lang_value.startswith('cs_'):
-                            return 'cs'
-                        elif lang_value.startswith('hu_'):
-                            return 'hu'
-                        elif lang_value.startswith('ro_'):
-                            return 'ro'
-                        elif lang_value.startswith('uk_'):
-                            return 'uk'
-                        elif lang_value.startswith('el_'):
-                            return 'el'
-                        elif lang_value.startswith('he_'):
-                            return 'he'
-                        elif lang_value.startswith('hi_'):
-                            return 'hi'
-                        elif lang_value.startswith('id_'):
-                            return 'id'
-                        elif lang_value.startswith('ms_'):
-                            return 'ms'
+            with trace_span("revalidate_translation", "i18n", lang=lang_code):
+                revalidate_translation(lang_code)
         except Exception as e:
-            print(f"Error reading batocera.conf: {e}")
-    return "en"
+            print(f"[BUA] Could not revalidate translation {lang_code}: {e}")
+        finally:
+            with _REVALIDATE_COND:
+                _REVALIDATE_SCHEDULED.discard(lang_code)
+
+def revalidate_translation(lang_code: str):
+    """Conditional GET for one cached language; queue the table if it changed."""
+    entry = dict(translation_cache_index().get(lang_code, {}))
+    if lang_code in stale_cached_translations():
+        entry = {}  # manifest hash differs: fetch unconditionally
+    status, body, validators = fetch_url_conditional(
+        f"{TRANSLATION_BASE_URL}/{lang_code}.json",
+        headers={"User-Agent": "BUA-Installer"},
+        etag=entry.get("etag") or None,
+        last_modified=entry.get("last_modified") or None,
+        timeout=5,
+    )
+    if status == 304:
+        mark_translation_checked(lang_code)
+        return
+    if status != 200 or not body:
+        print(f"[BUA] Translation {lang_code} revalidation returned HTTP {status}")
+        return
+    data = json.loads(body.decode("utf-8"))
+    changed = data != load_cached_translation(lang_code)
+    save_cached_translation(lang_code, data, body, validators)
+    if changed:
+        print(f"[BUA] Translation {lang_code} updated ({len(data)} keys), applying on next frame")
+        with _PENDING_TRANSLATIONS_LOCK:
+            _PENDING_TRANSLATIONS[lang_code] = data
+
+def mark_translation_checked(lang_code: str):
+    with _TRANSLATION_CACHE_LOCK:
+        index = translation_cache_index()
+        if lang_code in index:
+            index[lang_code]["checked"] = time.time()
+            try:
+                _atomic_write_json(TRANSLATION_CACHE_INDEX, index)
+            except Exception as e:
+                print(f"[BUA] Could not update translation cache index: {e}")
+
+def apply_pending_translations() -> bool:
+    """Swap in tables refreshed by the background worker (UI thread, once per frame)."""
+    if not _PENDING_TRANSLATIONS:
+        return False
+    with _PENDING_TRANSLATIONS_LOCK:
+        pending = dict(_PENDING_TRANSLATIONS)
+        _PENDING_TRANSLATIONS.clear()
+    TRANSLATIONS.update(pending)
+    if "en" not in pending and CURRENT_LANGUAGE not in pending:
+        return False
+    compile_translations()
+    remember_language_snapshot()
+    refresh_translated_screens()
+    return True
+
+# ---------- batocera.conf ----------
+class BatoceraConf:
+    """batocera.conf parsed once into a key/value map; re-read only when the
+    file's mtime or size changes, so lookups are dictionary hits."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._stamp: Tuple[int, int] | None = None
+        self._values: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _refresh(self):
+        try:
+            st = os.stat(self.path)
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self._stamp:
+            return
+        values: Dict[str, str] = {}
+        if stamp is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line or line.startswith("#") or "=" not in line:
+                            continue
+                        key, value = line.split("=", 1)
+                        values[key.strip()] = value.strip()
+            except Exception as e:
+                print(f"Error reading batocera.conf: {e}")
+                return
+        self._values = values
+        self._stamp = stamp
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        with self._lock:
+            self._refresh()
+            return self._values.get(key, default)
+
+    def items(self) -> Dict[str, str]:
+        """Copy of all settings."""
+        with self._lock:
+            self._refresh()
+            return dict(self._values)
+
+BATOCERA_CONFIG = BatoceraConf(BATOCERA_CONF)
+
+# batocera locale (system.language, e.g. "fr_FR") -> BUA language code.
+# Full-locale matches are checked first, then the part before the "_".
+BATOCERA_LOCALE_OVERRIDES = {
+    "pt_BR": "pt_BR",
+    "zh_CN": "zh",
+    "zh_TW": "zh_TW",
+}
+BATOCERA_LOCALE_LANGUAGES = {
+    "en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "ar", "nl", "pl", "tr", "vi", "th",
+    "sv", "no", "da", "fi", "cs", "hu", "ro", "uk", "el", "he", "hi", "id", "ms",
+}
+
+def batocera_locale_to_language(locale: str) -> str | None:
+    for prefix, code in BATOCERA_LOCALE_OVERRIDES.items():
+        if locale.startswith(prefix):
+            return code
+    lang, sep, _region = locale.partition("_")
+    if sep and lang in BATOCERA_LOCALE_LANGUAGES:
+        return lang
+    return None
 
+def get_batocera_language() -> str:
+    """Read system language from batocera.conf"""
+    locale = BATOCERA_CONFIG.get("system.language")
+    return (locale and batocera_locale_to_language(locale)) or "en"
+
+@traced("load_language", "i18n")
 def load_language():
     """Load saved language preference"""
     global CURRENT_LANGUAGE, TRANSLATIONS
 
-    # Priority 1: Check if user has manually set a language in BUA
-    user_set_language = False
-    try:
-        if os.path.exists(LANGUAGE_FILE):
-            with open(LANGUAGE_FILE, 'r') as f:
-                lang = f.read().strip()
-                if lang:
-                    CURRENT_LANGUAGE = lang
-                    user_set_language = True
-    except Exception:
-        pass
+    saved = SETTINGS.language
+    inputs = snapshot_inputs([BATOCERA_CONF, TRANSLATION_CACHE_INDEX])
+    snap = take_snapshot_section("language", saved)
+    tables = snapshot_translations(snap.get("shards") or {}) if snap else None
+    if tables:
+        CURRENT_LANGUAGE = snap["current"]
+        for code, table in tables.items():
+            TRANSLATIONS.setdefault(code, table)
+            schedule_translation_revalidation(code)
+        compile_translations()
+        return
 
-    # Priority 2: If no user preference, use batocera.conf language
-    if not user_set_language:
-        CURRENT_LANGUAGE = get_batocera_language()
+    # Priority 1: the language picked in BUA, priority 2: batocera.conf
+    CURRENT_LANGUAGE = saved or get_batocera_language()
 
     # Load English as fallback
     if "en" not in TRANSLATIONS:
@@ -309,46 +904,126 @@ def load_language():
     if CURRENT_LANGUAGE != "en" and CURRENT_LANGUAGE not in TRANSLATIONS:
         TRANSLATIONS[CURRENT_LANGUAGE] = load_translation_file(CURRENT_LANGUAGE)
 
-def save_language(lang: str):
-    """Save language preference and reload translations"""
+    compile_translations()
+    remember_language_snapshot(inputs, saved)
+
+def snapshot_translations(shards: Dict[str, str]) -> Dict[str, Dict[str, str]] | None:
+    """Cached tables for a language snapshot ({code: shard sha1}), or None if a
+    shard is missing or has changed since."""
+    index = translation_cache_index()
+    tables = {}
+    for code, sha1 in shards.items():
+        table = load_cached_translation(code) if index.get(code, {}).get("sha1") == sha1 else None
+        if not table:
+            return None
+        tables[code] = table
+    return tables
+
+def remember_language_snapshot(inputs: Dict[str, list] | None = None, saved: str | None = None):
+    """Snapshot the resolved language and the versions of its cached shards
+    (the tables themselves stay in the shards) unless a download failed, so
+    it is retried next launch. The snapshot is keyed by the saved language setting."""
+    codes = {"en", CURRENT_LANGUAGE}
+    index = translation_cache_index()
+    if all(TRANSLATIONS.get(c) and c in index for c in codes):
+        if inputs is None:
+            inputs = snapshot_inputs([BATOCERA_CONF, TRANSLATION_CACHE_INDEX])
+        if saved is None:
+            saved = SETTINGS.language
+        remember_snapshot_section("language", {
+            "current": CURRENT_LANGUAGE,
+            "shards": {c: index[c]["sha1"] for c in codes},
+        }, inputs, saved)
+
+def save_language(lang: str, table: Dict[str, str] | None = None):
+    """Save language preference and reload translations (or use an already loaded table)"""
     global CURRENT_LANGUAGE, TRANSLATIONS
-    try:
-        os.makedirs(os.path.dirname(LANGUAGE_FILE), exist_ok=True)
-        with open(LANGUAGE_FILE, 'w') as f:
-            f.write(lang)
-    except Exception:
-        pass
+    SETTINGS.language = lang
 
     # Update current language
     CURRENT_LANGUAGE = lang
 
     # Load the new language if not already loaded or force reload
-    TRANSLATIONS[lang] = load_translation_file(lang)
+    TRANSLATIONS[lang] = table if table is not None else load_translation_file(lang)
+    compile_translations()
+    remember_language_snapshot()
+
+# Current language merged over English, rebuilt by compile_translations()
+TRANSLATION_TABLE: Dict[str, str] = {}
+# Strings and maps derived from translations (hint lines, category labels);
+# only valid for the current table, cleared whenever it is recompiled
+_UI_TEXT_CACHE: Dict[object, object] = {}
+
+def compile_translations():
+    """Merge the current language over English into TRANSLATION_TABLE.
+    Call after TRANSLATIONS or CURRENT_LANGUAGE change."""
+    global TRANSLATION_TABLE
+    table = {k: v for k, v in TRANSLATIONS.get("en", {}).items() if v}
+    if CURRENT_LANGUAGE != "en":
+        table.update((k, v) for k, v in TRANSLATIONS.get(CURRENT_LANGUAGE, {}).items() if v)
+    TRANSLATION_TABLE = table
+    _UI_TEXT_CACHE.clear()
+
+_PREFETCHING: set = set()
+_PREFETCH_LOCK = threading.Lock()
+
+def prefetch_translation(lang_code: str):
+    """Download a language into the cache in the background if it isn't there yet."""
+    if lang_code in TRANSLATIONS or lang_code in translation_cache_index():
+        return
+    with _PREFETCH_LOCK:
+        if lang_code in _PREFETCHING:
+            return
+        _PREFETCHING.add(lang_code)
+
+    def run():
+        try:
+            load_translation_file(lang_code)
+        finally:
+            with _PREFETCH_LOCK:
+                _PREFETCHING.discard(lang_code)
+
+    threading.Thread(target=run, name=f"bua-prefetch-{lang_code}", daemon=True).start()
 
 def t(key: str) -> str:
-    """Translate a key to the current language"""
-    # Try current language
-    if CURRENT_LANGUAGE in TRANSLATIONS:
-        value = TRANSLATIONS[CURRENT_LANGUAGE].get(key)
-        if value:
-            return value
-
-    # Fallback to English
-    if "en" in TRANSLATIONS:
-        value = TRANSLATIONS["en"].get(key)
-        if value:
-            return value
-
-    # Last resort: return key itself
-    return key
+    """Translate a key to the current language (English, then the key itself, as fallback)"""
+    return TRANSLATION_TABLE.get(key, key)
+
+def ui_text(key, build):
+    """Return build() cached under key until the language changes."""
+    value = _UI_TEXT_CACHE.get(key)
+    if value is None:
+        value = _UI_TEXT_CACHE[key] = build()
+    return value
+
+def hint_line(*parts: Tuple[str, str], sep: str = " | ") -> str:
+    """Build 'A=<label> | B=<label>' from (button, translation key) pairs, cached per language."""
+    return ui_text(("hint", sep) + parts,
+                   lambda: sep.join(f"{button}={t(key)}" for button, key in parts))
+
+# Top-level category names as used in CATEGORIES, with their translation keys
+CATEGORY_LABEL_KEYS = {
+    "Games": "games",
+    "Windows Freeware": "windows_freeware",
+    "Game Utilities": "game_utilities",
+    "System Utilities": "system_utilities",
+    "Developer Tools": "developer_tools",
+    "Docker Menu": "docker_menu",
+}
+
+def category_for_label(label: str) -> str:
+    """Map a translated top-level label back to its English category name."""
+    reverse = ui_text("category_map", lambda: {t(key): name for name, key in CATEGORY_LABEL_KEYS.items()})
+    return reverse.get(label, label)
 
 def check_language_exists(lang_data: Tuple[str, str, str], results: list, lock: threading.Lock):
     """Check if a language file exists on GitHub (threaded helper)"""
+    import urllib.request
     name, code, native = lang_data
     github_url = f"{TRANSLATION_BASE_URL}/{code}.json"
     try:
         req = urllib.request.Request(github_url, headers={"User-Agent": "BUA-Installer"}, method='HEAD')
-        with urllib.request.urlopen(req, timeout=2) as response:
+        with urllib.request.urlopen(req, timeout=network_timeout(2)) as response:
             if response.status == 200:
                 with lock:
                     results.append((name, code, native))
@@ -356,6 +1031,121 @@ def check_language_exists(lang_data: Tuple[str, str, str], results: list, lock:
         # File doesn't exist on GitHub, skip it
         pass
 
+# Languages the UI knows how to name: code -> (English name, native name)
+LANGUAGE_NAMES: Dict[str, Tuple[str, str]] = {
+    "ar": ("Arabic", "العربية"),
+    "zh": ("Chinese (Simplified)", "简体中文"),
+    "zh_TW": ("Chinese (Traditional)", "繁體中文"),
+    "cs": ("Czech", "Čeština"),
+    "da": ("Danish", "Dansk"),
+    "nl": ("Dutch", "Nederlands"),
+    "en": ("English", "English"),
+    "fi": ("Finnish", "Suomi"),
+    "fr": ("French", "Français"),
+    "de": ("German", "Deutsch"),
+    "el": ("Greek", "Ελληνικά"),
+    "he": ("Hebrew", "עברית"),
+    "hi": ("Hindi", "हिन्दी"),
+    "hu": ("Hungarian", "Magyar"),
+    "id": ("Indonesian", "Bahasa Indonesia"),
+    "it": ("Italian", "Italiano"),
+    "ja": ("Japanese", "日本語"),
+    "ko": ("Korean", "한국어"),
+    "ms": ("Malay", "Bahasa Melayu"),
+    "no": ("Norwegian", "Norsk"),
+    "pl": ("Polish", "Polski"),
+    "pt": ("Portuguese", "Português"),
+    "pt_BR": ("Portuguese (Brazil)", "Português (Brasil)"),
+    "ro": ("Romanian", "Română"),
+    "ru": ("Russian", "Русский"),
+    "es": ("Spanish", "Español"),
+    "sv": ("Swedish", "Svenska"),
+    "th": ("Thai", "ไทย"),
+    "tr": ("Turkish", "Türkçe"),
+    "uk": ("Ukrainian", "Українська"),
+    "vi": ("Vietnamese", "Tiếng Việt"),
+}
+
+# Published list of translations with key counts and content hashes
+# (generated by .github/scripts/update_translation_manifest.py)
+LANGUAGE_MANIFEST_URL = f"{TRANSLATION_BASE_URL}/manifest.json"
+LANGUAGE_MANIFEST_FILE = "/userdata/system/add-ons/bua_language_manifest.json"
+LANGUAGE_MANIFEST_TTL = 24 * 3600
+
+_LANGUAGE_MANIFEST: dict | None = None  # persisted form: {manifest, etag, last_modified, fetched}
+_LANGUAGE_MANIFEST_LOCK = threading.Lock()
+
+def _stored_language_manifest() -> dict:
+    """Persisted manifest (read from disk once per process)."""
+    global _LANGUAGE_MANIFEST
+    with _LANGUAGE_MANIFEST_LOCK:
+        if _LANGUAGE_MANIFEST is None:
+            _LANGUAGE_MANIFEST = _read_language_manifest_file()
+        return _LANGUAGE_MANIFEST
+
+def _read_language_manifest_file() -> dict:
+    try:
+        with open(LANGUAGE_MANIFEST_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and isinstance(data.get("manifest"), dict):
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"[BUA] Could not read language manifest: {e}")
+    return {}
+
+def _refresh_language_manifest() -> dict:
+    """Conditional GET of the manifest; persists and returns the stored form."""
+    global _LANGUAGE_MANIFEST
+    with _LANGUAGE_MANIFEST_LOCK:
+        stored = _LANGUAGE_MANIFEST or {}
+        try:
+            status, body, validators = fetch_url_conditional(
+                LANGUAGE_MANIFEST_URL,
+                headers={"User-Agent": "BUA-Installer"},
+                etag=stored.get("etag"),
+                last_modified=stored.get("last_modified"),
+                timeout=5,
+            )
+            if status == 304 and stored:
+                stored = dict(stored, fetched=time.time())
+            elif status == 200 and body:
+                stored = {"manifest": json.loads(body.decode("utf-8")), "fetched": time.time(), **validators}
+            else:
+                print(f"[BUA] Language manifest unavailable (HTTP {status})")
+                return stored
+            _LANGUAGE_MANIFEST = stored
+            _atomic_write_json(LANGUAGE_MANIFEST_FILE, stored, ensure_ascii=False)
+        except Exception as e:
+            print(f"[BUA] Could not refresh language manifest: {e}")
+        return stored
+
+def load_language_manifest(max_age: float = LANGUAGE_MANIFEST_TTL) -> Dict[str, dict]:
+    """Published languages as {code: {keys, sha1}}; empty if never fetched.
+    A persisted copy younger than max_age is used as is. An older one is still
+    returned straight away and revalidated in the background; only a missing
+    manifest is fetched before returning."""
+    stored = _stored_language_manifest()
+    if not stored:
+        stored = _refresh_language_manifest()
+    elif time.time() - stored.get("fetched", 0) >= max_age:
+        threading.Thread(target=_refresh_language_manifest, name="bua-lang-manifest", daemon=True).start()
+    return (stored.get("manifest") or {}).get("languages", {})
+
+def stale_cached_translations() -> List[str]:
+    """Cached languages whose content hash no longer matches the manifest.
+    Uses the manifest already in memory/on disk; never touches the network."""
+    published = (_stored_language_manifest().get("manifest") or {}).get("languages", {})
+    index = translation_cache_index()
+    return sorted(code for code, entry in index.items()
+                  if code in published and published[code].get("sha1") != entry.get("sha1"))
+
+def _language_entry(code: str) -> Tuple[str, str, str]:
+    name, native = LANGUAGE_NAMES.get(code, (code, code))
+    return (name, code, native)
+
+@traced("get_available_languages", "i18n")
 def get_available_languages() -> List[Tuple[str, str, str]]:
     """Get list of available languages as (name, code, native_name) tuples from GitHub"""
     global AVAILABLE_LANGUAGES_CACHE, LANGUAGES_CACHE_CHECKED
@@ -364,63 +1154,35 @@ def get_available_languages() -> List[Tuple[str, str, str]]:
     if LANGUAGES_CACHE_CHECKED:
         return AVAILABLE_LANGUAGES_CACHE
 
-    # All potential languages - will be filtered to only show what exists on GitHub
-    # Format: (English name, code, native name)
-    all_languages = [
-        ("Arabic", "ar", "العربية"),
-        ("Chinese (Simplified)", "zh", "简体中文"),
-        ("Chinese (Traditional)", "zh_TW", "繁體中文"),
-        ("Czech", "cs", "Čeština"),
-        ("Danish", "da", "Dansk"),
-        ("Dutch", "nl", "Nederlands"),
-        ("English", "en", "English"),
-        ("Finnish", "fi", "Suomi"),
-        ("French", "fr", "Français"),
-        ("German", "de", "Deutsch"),
-        ("Greek", "el", "Ελληνικά"),
-        ("Hebrew", "he", "עברית"),
-        ("Hindi", "hi", "हिन्दी"),
-        ("Hungarian", "hu", "Magyar"),
-        ("Indonesian", "id", "Bahasa Indonesia"),
-        ("Italian", "it", "Italiano"),
-        ("Japanese", "ja", "日本語"),
-        ("Korean", "ko", "한국어"),
-        ("Malay", "ms", "Bahasa Melayu"),
-        ("Norwegian", "no", "Norsk"),
-        ("Polish", "pl", "Polski"),
-        ("Portuguese", "pt", "Português"),
-        ("Portuguese (Brazil)", "pt_BR", "Português (Brasil)"),
-        ("Romanian", "ro", "Română"),
-        ("Russian", "ru", "Русский"),
-        ("Spanish", "es", "Español"),
-        ("Swedish", "sv", "Svenska"),
-        ("Thai", "th", "ไทย"),
-        ("Turkish", "tr", "Türkçe"),
-        ("Ukrainian", "uk", "Українська"),
-        ("Vietnamese", "vi", "Tiếng Việt"),
-    ]
-
-    # Check which languages actually exist on GitHub (in parallel for speed)
-    available_languages = []
-    lock = threading.Lock()
-    threads = []
-
-    for lang_data in all_languages:
-        thread = threading.Thread(target=check_language_exists, args=(lang_data, available_languages, lock))
-        thread.daemon = True
-        thread.start()
-        threads.append(thread)
-
-    # Wait for all checks to complete (max 3 seconds total)
-    for thread in threads:
-        thread.join(timeout=3)
+    codes = set(load_language_manifest())
+    if codes:
+        stale = stale_cached_translations()
+        if stale:
+            print(f"[BUA] Cached translations out of date: {', '.join(stale)}")
+    elif network_available():
+        # No manifest published/reachable: fall back to probing each known language
+        found = []
+        lock = threading.Lock()
+        threads = []
+        for code in LANGUAGE_NAMES:
+            thread = threading.Thread(target=check_language_exists, args=(_language_entry(code), found, lock))
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        # Wait for all checks to complete (max 3 seconds total)
+        deadline = time.monotonic() + 3
+        for thread in threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        codes = {code for _name, code, _native in found}
+    else:
+        # Offline: whatever has been downloaded before
+        codes = set(translation_cache_index())
 
     # Always ensure English is available as fallback
-    if not any(lang[1] == "en" for lang in available_languages):
-        available_languages.append(("English", "en", "English"))
+    codes.add("en")
 
     # Cache the result
-    AVAILABLE_LANGUAGES_CACHE = sorted(available_languages, key=lambda x: x[0])
+    AVAILABLE_LANGUAGES_CACHE = sorted((_language_entry(c) for c in codes), key=lambda x: x[0])
     LANGUAGES_CACHE_CHECKED = True
 
     return AVAILABLE_LANGUAGES_CACHE
@@ -429,102 +1191,866 @@ def get_available_languages() -> List[Tuple[str, str, str]]:
 # load_language() - moved to play_splash_and_load()
 
 # ------------------------------
-# Installation History Manager
+# State database
 # ------------------------------
+# Install events, settings, update-check results and cached remote files live
+# in one SQLite database that is opened once per session. Without sqlite3 (or
+# if the database cannot be opened) the per-file stores are used instead.
+
+STATE_DB_FILE = "/userdata/system/add-ons/bua_state.db"
+STATE_DB_SCHEMA = 1
+
+STATE_DB_TABLES = """
+CREATE TABLE IF NOT EXISTS install_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    app TEXT NOT NULL,
+    date TEXT NOT NULL,
+    success INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS install_events_app ON install_events (app, success);
+CREATE TABLE IF NOT EXISTS settings (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS update_checks (
+    app TEXT PRIMARY KEY,
+    checked REAL NOT NULL,
+    remote_ts REAL,
+    status TEXT NOT NULL,  -- translation key
+    needs_update INTEGER NOT NULL,
+    detail TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS remote_cache (
+    url TEXT PRIMARY KEY,
+    etag TEXT NOT NULL DEFAULT '',
+    last_modified TEXT NOT NULL DEFAULT '',
+    fetched REAL NOT NULL,
+    body BLOB
+);
+CREATE TABLE IF NOT EXISTS install_perf (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    app TEXT NOT NULL,
+    action TEXT NOT NULL,
+    started TEXT NOT NULL,
+    duration REAL NOT NULL,
+    exit_code INTEGER,
+    success INTEGER NOT NULL,
+    net_rx_bytes INTEGER NOT NULL,
+    disk_write_bytes INTEGER NOT NULL,
+    cpu_user REAL NOT NULL,
+    cpu_system REAL NOT NULL,
+    peak_rss INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS install_perf_app ON install_perf (app, id);
+"""
 
-HISTORY_FILE = "/userdata/system/add-ons/bua_history.json"
+# Settings that used to live in a file each; imported when the database is
+# created (the file is then renamed to *.migrated), read from the file without it
+LEGACY_SETTING_FILES: Dict[str, str] = {
+    "language": LANGUAGE_FILE,
+    "resolution": RESOLUTION_FILE,
+    "cards_per_page": CARDS_PER_PAGE_FILE,
+    "changelog_hash": CHANGELOG_HASH_FILE,
+    "controls": CONTROLS_FILE,
+}
 
-def load_history() -> Dict:
-    """Load installation history from file"""
+class StateDB:
+    """Lazily opened SQLite connection shared by all threads (serialised by a lock)."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._failed = False
+        self._depth = 0
+        self._lock = threading.RLock()
+
+    def _connect(self):
+        if self._conn is not None or self._failed:
+            return self._conn
+        try:
+            with trace_span("open_state_db", "io"):
+                import sqlite3
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                # WAL + NORMAL: commits never corrupt the database; a power cut can
+                # only lose the last ones, which are written off the UI thread anyway
+                conn.execute("PRAGMA synchronous=NORMAL")
+                version = conn.execute("PRAGMA user_version").fetchone()[0]
+                if version < STATE_DB_SCHEMA:
+                    self._upgrade(conn, version)
+                self._conn = conn
+        except Exception as e:
+            self._failed = True
+            self._conn = None
+            print(f"[BUA] State database unavailable, using per-file state: {e}")
+        return self._conn
+
+    def _upgrade(self, conn, version: int):
+        """Bring the schema up to date in one transaction. A new database also
+        takes over the per-file state; those files are renamed to *.migrated
+        only after the commit, so a failed import leaves them untouched."""
+        migrated: List[str] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in STATE_DB_TABLES.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            if version == 0:
+                migrated = self._import_legacy_state(conn)
+            conn.execute(f"PRAGMA user_version={STATE_DB_SCHEMA}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        for path in migrated:
+            try:
+                os.replace(path, path + ".migrated")
+            except OSError:
+                pass
+
+    def _import_legacy_state(self, conn) -> List[str]:
+        """Copy settings and history from their files; returns the files read."""
+        found = {}
+        for key, path in LEGACY_SETTING_FILES.items():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    value = f.read().strip()
+                if value:
+                    found[key] = (value, path)
+            except OSError:
+                pass
+        conn.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                         [(key, value) for key, (value, _path) in found.items()])
+        migrated = [path for _value, path in found.values()]
+        history_files = [path for path in (HISTORY_FILE, HISTORY_JOURNAL) if os.path.exists(path)]
+        if history_files:
+            entries, seq, _journaled, _legacy = read_history_files(HISTORY_FILE, HISTORY_JOURNAL)
+            conn.executemany("INSERT INTO install_events (app, date, success) VALUES (?, ?, ?)", history_rows(entries))
+            conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('history_seq', ?)", (str(seq),))
+            migrated += history_files
+        return migrated
+
+    def available(self) -> bool:
+        with self._lock:
+            return self._connect() is not None
+
+    def query(self, sql: str, params=()) -> list:
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def execute(self, sql: str, params=()):
+        """Run a single write (joins the surrounding transaction, if any)."""
+        with self._lock:
+            return self._connect().execute(sql, params)
+
+    @contextmanager
+    def transaction(self):
+        """Group writes into one atomic commit; nested calls join the outer one."""
+        with self._lock:
+            conn = self._connect()
+            if self._depth == 0:
+                conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield conn
+            except BaseException:
+                self._depth -= 1
+                if self._depth == 0:
+                    conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if self._depth == 0:
+                conn.execute("COMMIT")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+STATE = StateDB(STATE_DB_FILE)
+
+class StateWriter:
+    """Write-behind for persistent state.
+
+    Jobs handed to submit() run one after another, in order, on a single
+    background thread, so the UI thread never waits for a commit or an fsync.
+    flush() waits until everything submitted so far has run.
+    """
+
+    def __init__(self):
+        self._jobs: List = []
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, job):
+        with self._cond:
+            self._jobs.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="bua-state-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._jobs:
+                    self._cond.wait()
+                jobs, self._jobs = self._jobs, []
+                self._busy = True
+            for job in jobs:
+                try:
+                    job()
+                except Exception as e:
+                    print(f"[BUA] State write failed: {e}")
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for all submitted writes. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._jobs or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+STATE_WRITER = StateWriter()
+
+def get_setting(key: str, default: str | None = None) -> str | None:
+    """Read a stored setting (from its legacy file when the database is unavailable)."""
     try:
-        if os.path.exists(HISTORY_FILE):
-            with open(HISTORY_FILE, 'r') as f:
-                return json.load(f)
+        if STATE.available():
+            rows = STATE.query("SELECT value FROM settings WHERE key = ?", (key,))
+            return rows[0][0] if rows else default
+        path = LEGACY_SETTING_FILES.get(key)
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                value = f.read().strip()
+            if value:
+                return value
     except Exception as e:
-        print(f"Error loading history: {e}")
-    return {}
+        print(f"[BUA] Failed to read setting {key}: {e}")
+    return default
 
-def save_history(history: Dict):
-    """Save installation history to file"""
+def set_setting(key: str, value: str):
+    """Store a setting (in its legacy file when the database is unavailable)."""
     try:
-        os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
-        with open(HISTORY_FILE, 'w') as f:
-            json.dump(history, f, indent=2)
+        if STATE.available():
+            STATE.execute("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", (key, value))
+            return
+        path = LEGACY_SETTING_FILES.get(key)
+        if path:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp.{os.getpid()}"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp, path)
     except Exception as e:
-        print(f"Error saving history: {e}")
+        print(f"[BUA] Failed to save setting {key}: {e}")
 
-def mark_installed(app_name: str, success: bool):
-    """Mark an app as installed in history"""
-    history = load_history()
-    if app_name not in history:
-        history[app_name] = []
-    
-    history[app_name].append({
-        'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        'success': success
-    })
-    save_history(history)
+# ---------- Settings ----------
 
-def is_installed(app_name: str) -> bool:
-    """Check if app has been successfully installed"""
-    history = load_history()
-    if app_name in history:
-        # Check if any installation was successful
-        return any(entry['success'] for entry in history[app_name])
-    return False
+SETTINGS_FLUSH_DELAY = 0.5  # seconds without changes before they are written
 
-def scan_installed_addons_directory() -> dict:
-    """Scan /userdata/system/add-ons directory for installed apps.
-    Returns dict mapping app_name -> directory modification timestamp (or None if not found)."""
-    addons_dir = "/userdata/system/add-ons"
-    found_apps = {}
+class Settings:
+    """User preferences, read in one go and written back in coalesced batches.
 
-    try:
-        if not os.path.exists(addons_dir):
-            return {}
+    Values are held as stored (strings) and exposed as typed properties. A
+    change is written by STATE_WRITER SETTINGS_FLUSH_DELAY after the last one,
+    so stepping through options costs a single write: one transaction, or one
+    atomic file replace per changed setting without the database.
+    """
 
-        # List all items in add-ons directory
-        items = os.listdir(addons_dir)
-
-        # Match directory/file names against known app names
-        for app_name in APPS.keys():
-            dir_path = None
-            # Check if app name exists as directory or file
-            if app_name in items:
-                dir_path = os.path.join(addons_dir, app_name)
-            # Also check with common variations
-            elif app_name.replace(' ', '_') in items:
-                dir_path = os.path.join(addons_dir, app_name.replace(' ', '_'))
-            elif app_name.replace(' ', '-') in items:
-                dir_path = os.path.join(addons_dir, app_name.replace(' ', '-'))
-
-            if dir_path and os.path.exists(dir_path):
+    def __init__(self):
+        self._values: Dict[str, str] | None = None
+        self._dirty: set = set()
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
+
+    def load(self):
+        with self._lock:
+            if self._values is None:
+                with trace_span("load_settings", "io"):
+                    if STATE.available():
+                        self._values = dict(STATE.query("SELECT key, value FROM settings"))
+                    else:
+                        self._values = {}
+                        for key in LEGACY_SETTING_FILES:
+                            value = get_setting(key)
+                            if value is not None:
+                                self._values[key] = value
+
+    def _get(self, key: str) -> str | None:
+        self.load()
+        return self._values.get(key)
+
+    def _set(self, key: str, value: str):
+        with self._lock:
+            self.load()
+            if self._values.get(key) == value:
+                return
+            self._values[key] = value
+            self._dirty.add(key)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(SETTINGS_FLUSH_DELAY, STATE_WRITER.submit, (self.flush,))
+            self._timer.name = "bua-settings"
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Write pending changes now."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            changed = [(key, self._values[key]) for key in sorted(self._dirty)]
+            self._dirty.clear()
+            if STATE.available():
                 try:
-                    # Get modification time of the directory
-                    mtime = os.path.getmtime(dir_path)
-                    found_apps[app_name] = mtime
-                except Exception:
-                    found_apps[app_name] = None
+                    with STATE.transaction() as conn:
+                        conn.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", changed)
+                except Exception as e:
+                    self._dirty.update(key for key, _value in changed)  # retried on the next flush
+                    print(f"[BUA] Failed to save settings: {e}")
+            else:
+                for key, value in changed:
+                    set_setting(key, value)
+
+    @property
+    def language(self) -> str:
+        """Language picked in BUA ("" to follow batocera.conf)."""
+        return self._get("language") or ""
+
+    @language.setter
+    def language(self, value: str):
+        self._set("language", value)
+
+    @property
+    def resolution(self) -> Tuple[int, int] | None:
+        try:
+            width, height = self._get("resolution").split("x")
+            return int(width), int(height)
+        except (AttributeError, ValueError):
+            return None
+
+    @resolution.setter
+    def resolution(self, value: Tuple[int, int]):
+        self._set("resolution", f"{value[0]}x{value[1]}")
+
+    @property
+    def cards_per_page(self) -> str:
+        """'auto' or a number of cards such as '5'."""
+        return self._get("cards_per_page") or DEFAULT_CARDS_PER_PAGE
+
+    @cards_per_page.setter
+    def cards_per_page(self, value: str):
+        self._set("cards_per_page", value)
+
+    @property
+    def changelog_hash(self) -> str:
+        """Hash of the last changelog shown."""
+        return self._get("changelog_hash") or ""
+
+    @changelog_hash.setter
+    def changelog_hash(self, value: str):
+        self._set("changelog_hash", value)
+
+    @property
+    def button_map(self) -> dict:
+        """Manual controller mapping ({"A": button, ...}), empty if none was saved."""
+        try:
+            data = json.loads(self._get("controls") or "{}")
+            return data if isinstance(data, dict) else {}
+        except ValueError:
+            return {}
+
+    @button_map.setter
+    def button_map(self, mapping: dict):
+        self._set("controls", json.dumps(mapping, indent=2))
+
+SETTINGS = Settings()
+
+def fetch_cached_remote(url: str, timeout: int = 10) -> bytes | None:
+    """GET a remote file through the remote_cache table.
+
+    The stored copy is revalidated with a conditional request and served as-is
+    on 304, when offline or when the request fails. Returns None when there is
+    neither a response nor a stored copy.
+    """
+    cached = None
+    if STATE.available():
+        rows = STATE.query("SELECT etag, last_modified, body FROM remote_cache WHERE url = ?", (url,))
+        cached = rows[0] if rows else None
+    if cached is not None and not network_available():
+        return cached[2]
+    try:
+        status, body, validators = fetch_url_conditional(
+            url, {"User-Agent": "BUA-Updater"},
+            etag=cached[0] if cached else None,
+            last_modified=cached[1] if cached else None,
+            timeout=timeout,
+        )
     except Exception:
+        return cached[2] if cached else None
+    if status == 304 and cached is not None:
+        STATE.execute("UPDATE remote_cache SET fetched = ? WHERE url = ?", (time.time(), url))
+        return cached[2]
+    if status == 200 and body is not None:
+        if STATE.available():
+            STATE.execute(
+                "INSERT OR REPLACE INTO remote_cache (url, etag, last_modified, fetched, body) VALUES (?, ?, ?, ?, ?)",
+                (url, validators.get("etag", ""), validators.get("last_modified", ""), time.time(), body),
+            )
+        return body
+    return cached[2] if cached else None
+
+# ------------------------------
+# Installation History Manager
+# ------------------------------
+
+HISTORY_FILE = "/userdata/system/add-ons/bua_history.json"
+HISTORY_JOURNAL = "/userdata/system/add-ons/bua_history.jsonl"
+HISTORY_COMPACT_EVERY = 64    # journal records before folding them into the snapshot
+HISTORY_KEEP_ENTRIES = 10     # recent entries kept per app on compaction
+
+# Database counterpart of compaction: keep the latest success plus the last
+# HISTORY_KEEP_ENTRIES events of every app
+HISTORY_PRUNE_SQL = """
+DELETE FROM install_events WHERE id NOT IN (
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (PARTITION BY app ORDER BY id DESC) AS n FROM install_events
+    ) WHERE n <= ?
+) AND id NOT IN (SELECT MAX(id) FROM install_events WHERE success = 1 GROUP BY app)
+"""
+
+def read_history_files(path: str, journal_path: str) -> Tuple[Dict[str, List[dict]], int, int, bool]:
+    """Load a snapshot + journal: (entries, seq, journal records, snapshot predates the journal)."""
+    entries, seq, journaled, legacy = {}, 0, 0, False
+    try:
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                stored = json.load(f)
+            if isinstance(stored, dict) and isinstance(stored.get("apps"), dict):
+                entries, seq = stored["apps"], int(stored.get("seq", 0))
+            elif isinstance(stored, dict):
+                # Pre-journal format: the file was the bare {app: [entries]} map
+                entries, legacy = stored, True
+    except Exception as e:
+        print(f"Error loading history: {e}")
+    try:
+        with open(journal_path, 'r') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue    # torn write from a crash mid-append
+                journaled += 1
+                if record.get("seq", 0) > seq:
+                    apply_history_record(entries, record)
+                    seq = record["seq"]
+    except FileNotFoundError:
         pass
+    except Exception as e:
+        print(f"Error replaying history journal: {e}")
+    return entries, seq, journaled, legacy
+
+def apply_history_record(entries: Dict[str, List[dict]], record: dict):
+    app = record.get("app")
+    if record.get("removed"):
+        entries.pop(app, None)
+    else:
+        entries.setdefault(app, []).append({'date': record.get('date'), 'success': bool(record.get('success'))})
+
+def history_rows(entries: Dict[str, List[dict]]) -> List[tuple]:
+    """install_events rows for a history map."""
+    return [
+        (app, e.get('date') or '', int(bool(e.get('success'))))
+        for app, events in entries.items() for e in events
+    ]
+
+class InstallHistory:
+    """Installation history held in memory.
+
+    Changes apply to memory at once and are persisted by STATE_WRITER, in
+    batches: everything recorded since the last write goes out together.
+    With the state database every change is one row in install_events.
+    Without it, bua_history.json is a compacted snapshot
+    ({"seq", "apps": {app: [entries]}}), and every change since is one line
+    appended (and fsynced) to bua_history.jsonl, so recording an install
+    costs the same however long the history is. Once the journal grows past
+    HISTORY_COMPACT_EVERY records it is folded into a new snapshot, keeping
+    the latest success plus the last HISTORY_KEEP_ENTRIES entries per app.
+    Journal records carry a sequence number, so a crash mid-compaction never
+    replays a change twice. History found in these files is imported when
+    the database is created.
+    """
+
+    def __init__(self, path: str, journal_path: str):
+        self.path = path
+        self.journal_path = journal_path
+        self._entries: Dict[str, List[dict]] | None = None
+        self._installed: set = set()
+        self._lock = threading.RLock()
+        self._seq = 0           # sequence number of the last change
+        self._journaled = 0     # records in the journal
+        self._journal = None    # only used on the writer thread
+        self._unwritten: List[dict] = []  # changes not yet handed to storage
+        self._compacting = False
+        self._listeners: List = []
+
+    def subscribe(self, listener):
+        """Call listener(app, installed) whenever an app enters or leaves the installed
+        set; app is None when the whole history was replaced."""
+        self._listeners.append(listener)
+
+    def _notify(self, app_name: str | None, installed: bool):
+        # Called without the lock held, so listeners may query the history
+        for listener in self._listeners:
+            try:
+                listener(app_name, installed)
+            except Exception as e:
+                print(f"[BUA] History listener failed: {e}")
+
+    def _load(self) -> Dict[str, List[dict]]:
+        if self._entries is not None:
+            return self._entries
+        if STATE.available():
+            self._read_db()
+            compact = False
+        else:
+            compact = self._read_files()
+        self._installed = {
+            app for app, events in self._entries.items()
+            if any(e.get('success') for e in events)
+        }
+        if compact or self._journaled >= HISTORY_COMPACT_EVERY:
+            self._schedule_compaction()
+        return self._entries
+
+    def _read_files(self) -> bool:
+        """Load snapshot + journal. Returns True if the snapshot predates the journal."""
+        self._entries, self._seq, self._journaled, legacy = read_history_files(self.path, self.journal_path)
+        return legacy
+
+    def _read_db(self):
+        # Files from the per-file store were imported when the database was created
+        self._entries = {}
+        for app, date, success in STATE.query("SELECT app, date, success FROM install_events ORDER BY id"):
+            self._entries.setdefault(app, []).append({'date': date, 'success': bool(success)})
+        self._seq = int(get_setting("history_seq", "0"))
+        # Rows beyond what compaction keeps count towards the next compaction
+        self._journaled = sum(max(0, len(events) - HISTORY_KEEP_ENTRIES) for events in self._entries.values())
+
+    def _close_journal(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _append(self, record: dict):
+        """Apply a change and queue it for writing (lock held)."""
+        self._seq += 1
+        record["seq"] = self._seq
+        apply_history_record(self._entries, record)
+        self._unwritten.append(record)
+        if len(self._unwritten) == 1:
+            STATE_WRITER.submit(self._write_unwritten)
+        self._journaled += 1
+        if self._journaled >= HISTORY_COMPACT_EVERY:
+            self._schedule_compaction()
+
+    def _write_unwritten(self):
+        """Persist all queued changes in one go (writer thread)."""
+        with self._lock:
+            records, self._unwritten = self._unwritten, []
+        if not records:
+            return
+        try:
+            if STATE.available():
+                with STATE.transaction() as conn:
+                    for record in records:
+                        if record.get("removed"):
+                            conn.execute("DELETE FROM install_events WHERE app = ?", (record["app"],))
+                        else:
+                            conn.execute("INSERT INTO install_events (app, date, success) VALUES (?, ?, ?)",
+                                         (record["app"], record["date"], int(record["success"])))
+                        # A stored update check is stale once the app's history changes
+                        conn.execute("DELETE FROM update_checks WHERE app = ?", (record["app"],))
+                    conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('history_seq', ?)",
+                                 (str(records[-1]["seq"]),))
+            else:
+                if self._journal is None:
+                    os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+                    self._journal = open(self.journal_path, 'a', encoding='utf-8')
+                self._journal.write("".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records))
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+        except Exception as e:
+            print(f"Error writing history journal: {e}")
+
+    def _schedule_compaction(self):
+        if self._compacting:
+            return
+        self._compacting = True
+        STATE_WRITER.submit(self._compact_queued)
+
+    def _compact_queued(self):
+        try:
+            self.compact()
+        finally:
+            self._compacting = False
+
+    def compact(self):
+        """Drop all but the latest success and the last HISTORY_KEEP_ENTRIES entries per app
+        (and fold the journal into a fresh snapshot without the database). Runs on the
+        writer thread, or with the writer idle."""
+        try:
+            with self._lock:
+                apps = {}
+                for app, events in self._load().items():
+                    kept = events[-HISTORY_KEEP_ENTRIES:]
+                    last_ok = next((e for e in reversed(events) if e.get('success')), None)
+                    if last_ok is not None and last_ok not in kept:
+                        kept = [last_ok] + kept
+                    apps[app] = kept
+                self._entries = apps
+                seq = self._seq
+                self._journaled = len(self._unwritten)
+            # Changes still queued are covered by the snapshot (their seq is <= seq)
+            # and skipped when the journal is replayed
+            if STATE.available():
+                STATE.execute(HISTORY_PRUNE_SQL, (HISTORY_KEEP_ENTRIES,))
+            else:
+                _atomic_write_json(self.path, {"seq": seq, "apps": apps}, fsync=True, indent=2)
+                # Every journal record is now covered by the snapshot's seq
+                if self._journal is not None:
+                    self._journal.truncate(0)
+                elif os.path.exists(self.journal_path):
+                    open(self.journal_path, 'w').close()
+        except Exception as e:
+            print(f"Error compacting history: {e}")
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for queued writes and close the journal. Returns True if clean."""
+        if not STATE_WRITER.flush(timeout):
+            return False
+        self._close_journal()
+        return True
 
-    return found_apps
+    @property
+    def version(self) -> int:
+        return self._seq
+
+    def stored_version(self) -> str:
+        """Change marker of the persisted history, read without loading it
+        (the in-memory one once loaded, as queued changes are written shortly).
+        Empty for the per-file store, whose file stamps serve the same purpose."""
+        if not STATE.available():
+            return ""
+        if self._entries is not None:
+            return str(self._seq)
+        return get_setting("history_seq", "0")
+
+    def snapshot(self) -> Dict[str, List[dict]]:
+        """Copy of the full history ({app: [{'date', 'success'}]})."""
+        with self._lock:
+            return {app: list(events) for app, events in self._load().items()}
+
+    def replace(self, history: Dict):
+        """Swap in a whole new history; written in one go."""
+        with self._lock:
+            self._load()
+            self._entries = {app: list(events) for app, events in history.items()}
+            self._installed = {
+                app for app, events in self._entries.items()
+                if any(e.get('success') for e in events)
+            }
+            self._seq += 1
+            self._unwritten = []  # superseded by the new history
+        STATE_WRITER.submit(self._write_all)
+        self._notify(None, False)
+
+    def _write_all(self):
+        """Persist the whole history (writer thread)."""
+        if not STATE.available():
+            self.compact()
+            return
+        with self._lock:
+            rows, seq = history_rows(self._entries), self._seq
+        try:
+            with STATE.transaction() as conn:
+                conn.execute("DELETE FROM install_events")
+                conn.executemany("INSERT INTO install_events (app, date, success) VALUES (?, ?, ?)", rows)
+                conn.execute("INSERT OR REPLACE INTO settings (key, value) VALUES ('history_seq', ?)", (str(seq),))
+        except Exception as e:
+            print(f"Error writing history: {e}")
+
+    def installed(self) -> frozenset:
+        """Names of all apps with at least one successful install."""
+        with self._lock:
+            self._load()
+            return frozenset(self._installed)
+
+    def is_installed(self, app_name: str) -> bool:
+        if self._entries is None:
+            with self._lock:
+                self._load()
+        return app_name in self._installed
+
+    def last_install_date(self, app_name: str) -> str | None:
+        with self._lock:
+            for entry in reversed(self._load().get(app_name, ())):
+                if entry.get('success'):
+                    return entry.get('date')
+        return None
+
+    def record(self, app_name: str, success: bool):
+        with self._lock:
+            self._load()
+            self._append({
+                'app': app_name,
+                'date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'success': success
+            })
+            added = success and app_name not in self._installed
+            if added:
+                self._installed.add(app_name)
+        if added:
+            self._notify(app_name, True)
+
+    def remove(self, app_name: str):
+        with self._lock:
+            entries = self._load()
+            removed = app_name in self._installed
+            if app_name in entries:
+                self._append({'app': app_name, 'removed': True})
+                self._installed.discard(app_name)
+        if removed:
+            self._notify(app_name, False)
+
+HISTORY = InstallHistory(HISTORY_FILE, HISTORY_JOURNAL)
+
+def load_history() -> Dict:
+    """Load installation history (served from memory after the first read)"""
+    return HISTORY.snapshot()
+
+def save_history(history: Dict):
+    """Replace the installation history with a freshly compacted snapshot"""
+    HISTORY.replace(history)
+
+def mark_installed(app_name: str, success: bool):
+    """Mark an app as installed in history"""
+    HISTORY.record(app_name, success)
+
+def is_installed(app_name: str) -> bool:
+    """Check if app has been successfully installed"""
+    return HISTORY.is_installed(app_name)
 
 def get_last_install_date(app_name: str) -> str:
     """Get the last successful installation date"""
-    history = load_history()
-    if app_name in history:
-        successful = [e for e in history[app_name] if e['success']]
-        if successful:
-            return successful[-1]['date']
-    return None
+    return HISTORY.last_install_date(app_name)
 
 def mark_uninstalled(app_name: str):
     """Remove an app from installation history"""
-    history = load_history()
-    if app_name in history:
-        del history[app_name]
-        save_history(history)
+    HISTORY.remove(app_name)
+
+# ---------- Installed-app index ----------
+# Maps what is on disk (add-on directories, ports launchers) and names found
+# in the history to catalog keys. Names are compared normalized, so
+# "endless-sky", "EndlessSky.sh" and "Endless Sky" are the same app.
+
+ADDONS_DIR = "/userdata/system/add-ons"
+PORTS_DIR = "/userdata/roms/ports"
+
+def normalize_app_name(name: str) -> str:
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+class InstalledIndex:
+    """Catalog apps present on disk, kept current with directory mtime checks.
+
+    A watched directory is listed again only when its mtime changes (an entry
+    was added, removed or renamed), so a lookup normally costs one stat per
+    directory. Earlier directories win when several match the same app.
+    """
+
+    def __init__(self, dirs: List[str]):
+        self.dirs = dirs
+        self._aliases: Dict[str, str] | None = None
+        self._listings: Dict[str, Tuple[int, Dict[str, float | None]]] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Forget aliases and listings (the catalog changed)."""
+        with self._lock:
+            self._aliases = None
+            self._listings.clear()
+
+    def aliases(self) -> Dict[str, str]:
+        """Normalized name -> catalog key, from app names and their install script names."""
+        if self._aliases is None:
+            aliases = {normalize_app_name(app): app for app in APPS}
+            for app, cmd in APPS.items():
+                script = re.search(r"([^/\s]+)\.sh\b", cmd)
+                if script:
+                    aliases.setdefault(normalize_app_name(script.group(1)), app)
+            self._aliases = aliases
+        return self._aliases
+
+    def catalog_key(self, name: str) -> str | None:
+        """Catalog key for a directory, launcher or history name (None if unknown)."""
+        if name in APPS:
+            return name
+        return self.aliases().get(normalize_app_name(os.path.splitext(name)[0] if name.endswith(".sh") else name))
+
+    def _list(self, path: str) -> Dict[str, float | None]:
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._listings.pop(path, None)
+            return {}
+        cached = self._listings.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        found = {}
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    app = self.catalog_key(entry.name)
+                    if app and app not in found:
+                        try:
+                            found[app] = entry.stat().st_mtime
+                        except OSError:
+                            found[app] = None
+        except OSError:
+            pass
+        self._listings[path] = (mtime, found)
+        return found
+
+    def present(self) -> Dict[str, float | None]:
+        """{app: modification time of its directory or launcher} for apps found on disk."""
+        with self._lock:
+            found = {}
+            for path in self.dirs:
+                for app, mtime in self._list(path).items():
+                    found.setdefault(app, mtime)
+            return found
+
+    def installed_apps(self) -> List[str]:
+        """Catalog apps that are in the install history or present on disk, sorted."""
+        apps = {self.catalog_key(name) for name in HISTORY.installed()}
+        apps.update(self.present())
+        apps.discard(None)
+        return sorted(apps)
+
+INSTALLED_INDEX = InstalledIndex([ADDONS_DIR, PORTS_DIR])
 
 def get_uninstall_command(install_cmd: str) -> str:
     """Convert an installation command to an uninstall command.
@@ -661,6 +2187,363 @@ CATEGORIES: Dict[str, List[str]] = {
     ],
 }
 
+# ---------- Catalog manifest ----------
+# The tables above are the built-in catalog. app/catalog.json publishes it for
+# both architectures and is generated from these tables by
+# .github/scripts/update_catalog_manifest.py, so edit the tables, not the
+# manifest. "categories" maps each architecture to its categories and their
+# apps in menu order, any field of an app entry may be an {arch: value} map,
+# and "arch" limits an app to the listed architectures. At startup the stored
+# copy is revalidated with a conditional GET and replaces the built-in tables,
+# so a catalog change reaches every installer without a new installer release.
+
+CATALOG_URL = "https://raw.githubusercontent.com/batocera-unofficial-addons/batocera-unofficial-addons/main/app/catalog.json"
+CATALOG_ARCH = "arm64"
+CATALOG_VERSION = 1
+CATALOG_FETCH_TIMEOUT = 3
+
+# App -> categories it is listed in, rebuilt (with the search index) whenever
+# the catalog changes
+APP_CATEGORIES: Dict[str, List[str]] = {}
+
+def index_catalog():
+    """Rebuild lookups derived from the catalog tables."""
+    global _CATALOG_FINGERPRINT
+    APP_CATEGORIES.clear()
+    for cat_name, app_list in CATEGORIES.items():
+        for app in app_list:
+            APP_CATEGORIES.setdefault(app, []).append(cat_name)
+    _CATALOG_FINGERPRINT = ""
+    SEARCH_INDEX.invalidate()
+
+def _for_arch(value):
+    """Resolve a manifest field that may be given per architecture."""
+    return value.get(CATALOG_ARCH) if isinstance(value, dict) else value
+
+def apply_catalog(manifest: dict) -> bool:
+    """Replace APPS, DESCRIPTIONS and CATEGORIES with a manifest's entries for this
+    architecture. Returns False (tables untouched) if the manifest is unusable."""
+    if not isinstance(manifest, dict) or manifest.get("version") != CATALOG_VERSION:
+        return False
+    apps: Dict[str, str] = {}
+    descriptions: Dict[str, str] = {}
+    for name, entry in (manifest.get("apps") or {}).items():
+        if "arch" in entry and CATALOG_ARCH not in entry["arch"]:
+            continue
+        script = _for_arch(entry.get("script"))
+        cmd = _for_arch(entry.get("cmd")) or (bua(script) if script else None)
+        if not cmd:
+            continue
+        apps[name] = cmd
+        description = _for_arch(entry.get("description"))
+        if description:
+            descriptions[name] = description
+    if not apps:
+        return False
+    categories = {
+        cat_name: [name for name in app_list if name in apps]
+        for cat_name, app_list in (_for_arch(manifest.get("categories")) or {}).items()
+    }
+    APPS.clear()
+    APPS.update(apps)
+    DESCRIPTIONS.clear()
+    DESCRIPTIONS.update(descriptions)
+    CATEGORIES.clear()
+    CATEGORIES.update({name: app_list for name, app_list in categories.items() if app_list})
+    index_catalog()
+    INSTALLED_INDEX.invalidate()
+    INSTALL_STATS.invalidate()
+    return True
+
+@traced("load_catalog")
+def load_catalog():
+    """Switch to the published catalog (stored copy, revalidated when online).
+    The built-in tables stay in use when there is neither."""
+    body = fetch_cached_remote(CATALOG_URL, timeout=CATALOG_FETCH_TIMEOUT)
+    if not body:
+        return
+    try:
+        if not apply_catalog(json.loads(body)):
+            print("[BUA] Ignoring catalog manifest with an unsupported format")
+    except ValueError as e:
+        print(f"[BUA] Ignoring malformed catalog manifest: {e}")
+
+_CATALOG_FINGERPRINT = ""
+
+def catalog_fingerprint() -> str:
+    """Short hash of the app catalog; snapshot state derived from it is keyed on this."""
+    global _CATALOG_FINGERPRINT
+    if not _CATALOG_FINGERPRINT:
+        blob = json.dumps([sorted(APPS), {name: sorted(apps) for name, apps in CATEGORIES.items()}], sort_keys=True)
+        _CATALOG_FINGERPRINT = hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+    return _CATALOG_FINGERPRINT
+
+class InstallStats:
+    """Installed/available counts in total and per category for the main menu.
+
+    Built once (from the warm-start snapshot or the history), then kept
+    current by history events, so an install or uninstall only touches the
+    counters of that app's categories. get() returns the live dict.
+    """
+
+    def __init__(self):
+        self._stats: dict | None = None
+        self._lock = threading.Lock()
+        HISTORY.subscribe(self._on_history_change)
+
+    def _build(self) -> dict:
+        key = f"{catalog_fingerprint()}:{HISTORY.stored_version()}"
+        snap = take_snapshot_section("stats", key)
+        if snap:
+            return snap
+        installed = HISTORY.installed()
+        return {
+            'total_installed': len(installed),
+            'total_available': len(APPS),
+            'category_stats': {
+                cat_name: (sum(1 for app in app_list if app in installed), len(app_list))
+                for cat_name, app_list in CATEGORIES.items()
+            },
+        }
+
+    def _remember(self):
+        """Keep the snapshot section in step with the counters (lock held)."""
+        key = f"{catalog_fingerprint()}:{HISTORY.stored_version()}"
+        stats = dict(self._stats, category_stats=dict(self._stats['category_stats']))
+        remember_snapshot_section("stats", stats, snapshot_inputs([HISTORY_FILE, HISTORY_JOURNAL]), key)
+
+    def invalidate(self):
+        """Rebuild on the next get() (the catalog changed)."""
+        with self._lock:
+            self._stats = None
+
+    def get(self) -> dict:
+        with self._lock:
+            if self._stats is None:
+                self._stats = self._build()
+                self._remember()
+            return self._stats
+
+    def _on_history_change(self, app_name: str | None, installed: bool):
+        with self._lock:
+            if self._stats is None:
+                return
+            if app_name is None:
+                self._stats = None  # rebuilt on the next get()
+                return
+            step = 1 if installed else -1
+            self._stats['total_installed'] += step
+            category_stats = self._stats['category_stats']
+            for cat_name in APP_CATEGORIES.get(app_name, ()):
+                count, total = category_stats[cat_name]
+                category_stats[cat_name] = (count + step, total)
+            self._remember()
+
+INSTALL_STATS = InstallStats()
+
+# ---------- Catalog search ----------
+# Global search looks queries up in an inverted index instead of scanning the
+# catalog: every word of an app's name, install script, description and
+# category labels (English and the current language) maps to the apps using it,
+# and a trigram index over those words finds misspelled or partial words.
+# Whole-word hits (exact or prefix) always outrank approximate ones (typos,
+# words found inside longer words); the field weight orders hits of one kind.
+
+# Field weights: a hit in the name outranks one in a category or description
+SEARCH_FIELD_WEIGHTS = {"name": 1.0, "script": 0.9, "category": 0.5, "description": 0.4}
+SEARCH_MIN_SIMILARITY = 0.3  # trigram (Dice) similarity for a word to be checked as a typo
+
+def search_tokens(text: str) -> List[str]:
+    """Lowercase, accent-free words of text."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    return re.findall(r"[^\W_]+", "".join(ch for ch in text if not unicodedata.combining(ch)))
+
+def _trigrams(token: str) -> set:
+    padded = f" {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _max_typos(word: str) -> int:
+    """Edits allowed for a query word to still match: none up to 3 letters
+    ("fox" is not "for"), one up to 7, two beyond."""
+    return 0 if len(word) <= 3 else 1 if len(word) <= 7 else 2
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance counting a swap of neighbours as one edit;
+    limit + 1 once it is known to exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+            if before is not None and i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cur[j] = min(cur[j], before[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        before, prev = prev, cur
+    return prev[-1]
+
+class TokenIndex:
+    """Word -> {app: field weight} postings, with a sorted vocabulary for prefix
+    lookups and a trigram index for fuzzy ones. Query words are matched inside
+    indexed words only when substrings is set (names and descriptions, not
+    category words, which would match half the catalog)."""
+
+    def __init__(self, substrings: bool = False):
+        self.substrings = substrings
+        self.postings: Dict[str, Dict[str, float]] = {}
+        self.vocabulary: List[str] = []
+        self.trigrams: Dict[str, List[str]] = {}
+
+    def add(self, app: str, text: str, weight: float):
+        for token in search_tokens(text):
+            docs = self.postings.setdefault(token, {})
+            if docs.get(app, 0.0) < weight:
+                docs[app] = weight
+
+    def finish(self) -> "TokenIndex":
+        self.vocabulary = sorted(self.postings)
+        for token in self.vocabulary:
+            for gram in _trigrams(token):
+                self.trigrams.setdefault(gram, []).append(token)
+        return self
+
+    def words_like(self, word: str) -> Dict[str, Tuple[int, float]]:
+        """Indexed words matching a query word -> (rank, quality): rank 1 for
+        whole-word hits, 0 for approximate ones, and a quality in (0, 1]."""
+        found: Dict[str, Tuple[int, float]] = {}
+        if word in self.postings:
+            found[word] = (1, 1.0)
+        i = bisect.bisect_left(self.vocabulary, word)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(word):
+            found.setdefault(self.vocabulary[i], (1, 0.85))
+            i += 1
+        if len(word) < 3:
+            return found
+        grams = _trigrams(word)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for token in self.trigrams.get(gram, ()):
+                shared[token] = shared.get(token, 0) + 1
+        max_typos = _max_typos(word)
+        for token, count in shared.items():
+            if token in found:
+                continue
+            if self.substrings and word in token:
+                found[token] = (0, 0.7)
+                continue
+            # A token of n letters has n padded trigrams
+            if 2.0 * count / (len(grams) + len(token)) < SEARCH_MIN_SIMILARITY:
+                continue
+            typos = _edit_distance(word, token, max_typos)
+            if typos <= max_typos:
+                found[token] = (0, 0.8 * (1.0 - typos / max(len(word), len(token))))
+        return found
+
+    def match(self, word: str) -> Dict[str, float]:
+        """App -> best score for one query word."""
+        scores: Dict[str, float] = {}
+        for token, (rank, quality) in self.words_like(word).items():
+            for app, weight in self.postings[token].items():
+                score = rank + quality * weight
+                if scores.get(app, 0.0) < score:
+                    scores[app] = score
+        return scores
+
+class SearchIndex:
+    """Ranked, typo-tolerant app search over the catalog.
+
+    The catalog part is built on the first search after index_catalog()
+    marks it stale; the translated category labels are indexed separately,
+    once per language.
+    """
+
+    def __init__(self):
+        self._names: TokenIndex | None = None          # app and script names
+        self._descriptions = TokenIndex()
+        self._categories = TokenIndex()
+        self._phrases: Dict[str, str] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Rebuild on the next search (the catalog changed)."""
+        with self._lock:
+            self._names = None
+
+    def _build(self):
+        names, descriptions, categories = TokenIndex(substrings=True), TokenIndex(substrings=True), TokenIndex()
+        phrases = {}
+        for app, cmd in APPS.items():
+            names.add(app, app, SEARCH_FIELD_WEIGHTS["name"])
+            script = re.search(r"([^/\s]+)\.sh\b", cmd)
+            if script:
+                names.add(app, script.group(1).replace("-", " ").replace("_", " "), SEARCH_FIELD_WEIGHTS["script"])
+            descriptions.add(app, DESCRIPTIONS.get(app, ""), SEARCH_FIELD_WEIGHTS["description"])
+            for cat_name in APP_CATEGORIES.get(app, ()):
+                categories.add(app, cat_name, SEARCH_FIELD_WEIGHTS["category"])
+            phrases[app] = " ".join(search_tokens(app))
+        self._descriptions = descriptions.finish()
+        self._categories = categories.finish()
+        self._phrases = phrases
+        self._names = names.finish()
+        self._generation += 1
+
+    def _labels(self) -> TokenIndex:
+        def build():
+            index = TokenIndex()
+            for cat_name, key in CATEGORY_LABEL_KEYS.items():
+                label = t(key)
+                if label == key:
+                    continue
+                for app in CATEGORIES.get(cat_name, ()):
+                    index.add(app, label, SEARCH_FIELD_WEIGHTS["category"])
+            return index.finish()
+        return ui_text(("search_labels", self._generation), build)
+
+    def search(self, query: str, limit: int = 0, categories: bool = True) -> List[str]:
+        """Apps matching every word of query, best match first. With
+        categories=False only names and descriptions are searched (for
+        filtering inside a category, where its name would match everything)."""
+        words = search_tokens(query)
+        if not words:
+            return []
+        with self._lock:
+            if self._names is None:
+                with trace_span("search_index", "catalog"):
+                    self._build()
+            indexes = [self._names, self._descriptions]
+            if categories:
+                indexes.append(self._categories)
+        if categories:
+            indexes.append(self._labels())
+        totals: Dict[str, float] | None = None
+        for word in words:
+            scores: Dict[str, float] = {}
+            for index in indexes:
+                for app, score in index.match(word).items():
+                    if scores.get(app, 0.0) < score:
+                        scores[app] = score
+            if totals is None:
+                totals = scores
+            else:
+                totals = {app: total + scores[app] for app, total in totals.items() if app in scores}
+            if not totals:
+                return []
+        phrase = " ".join(words)
+        for app in totals:
+            name = self._phrases.get(app, "")
+            if name == phrase:
+                totals[app] += 2.0
+            elif name.startswith(phrase):
+                totals[app] += 1.0
+        ranked = sorted(totals, key=lambda app: (-totals[app], app.lower()))
+        return ranked[:limit] if limit else ranked
+
+SEARCH_INDEX = SearchIndex()
+
 def get_top_level() -> List[Tuple[str, str]]:
     """Generate top-level menu items with current language translations"""
     return [
@@ -685,56 +2568,28 @@ SPECIAL_TOPLEVEL_RUN: Dict[str, str] = {
 # Pygame UI helpers
 # ------------------------------
 
-pygame.init()
-pygame.mouse.set_visible(False)
+# pygame, the display, fonts and controllers are initialised by boot()
 # Window caption will be set after translations load in play_splash_and_load()
 
 def load_saved_cards_per_page():
     """Load saved cards per page preference"""
     global CARDS_PER_PAGE
-    try:
-        if os.path.exists(CARDS_PER_PAGE_FILE):
-            with open(CARDS_PER_PAGE_FILE, 'r') as f:
-                value = f.read().strip()
-                if value:
-                    CARDS_PER_PAGE = value
-                    return value
-    except Exception:
-        pass
-    return DEFAULT_CARDS_PER_PAGE
+    CARDS_PER_PAGE = SETTINGS.cards_per_page
+    return CARDS_PER_PAGE
 
 def save_cards_per_page(value: str):
     """Save cards per page preference (e.g., 'auto', '3', '5', '7')"""
     global CARDS_PER_PAGE
-    try:
-        os.makedirs(os.path.dirname(CARDS_PER_PAGE_FILE), exist_ok=True)
-        with open(CARDS_PER_PAGE_FILE, 'w') as f:
-            f.write(value)
-        CARDS_PER_PAGE = value
-    except Exception:
-        pass
+    SETTINGS.cards_per_page = value
+    CARDS_PER_PAGE = value
 
 def load_saved_resolution():
     """Load saved resolution preference"""
-    try:
-        if os.path.exists(RESOLUTION_FILE):
-            with open(RESOLUTION_FILE, 'r') as f:
-                res = f.read().strip()
-                if res and 'x' in res:
-                    parts = res.split('x')
-                    return int(parts[0]), int(parts[1])
-    except Exception:
-        pass
-    return None
+    return SETTINGS.resolution
 
 def save_resolution(width: int, height: int):
     """Save resolution preference"""
-    try:
-        os.makedirs(os.path.dirname(RESOLUTION_FILE), exist_ok=True)
-        with open(RESOLUTION_FILE, 'w') as f:
-            f.write(f"{width}x{height}")
-    except Exception:
-        pass
+    SETTINGS.resolution = (width, height)
 
 def get_visible_items(list_h: int, item_h: int) -> int:
     """Calculate number of visible items based on user preference.
@@ -749,6 +2604,7 @@ def get_visible_items(list_h: int, item_h: int) -> int:
     except Exception:
         return max(1, list_h // item_h)
 
+@traced("should_show_changelog")
 def should_show_changelog() -> bool:
     """Check if changelog should be shown (has content and hasn't been shown for this version)."""
     if not CHANGELOG or not CHANGELOG.strip():
@@ -758,33 +2614,27 @@ def should_show_changelog() -> bool:
     current_hash = hashlib.md5(CHANGELOG.encode('utf-8')).hexdigest()
 
     # Check if we've shown this version before
-    try:
-        if os.path.exists(CHANGELOG_HASH_FILE):
-            with open(CHANGELOG_HASH_FILE, 'r') as f:
-                shown_hash = f.read().strip()
-                if shown_hash == current_hash:
-                    return False  # Already shown this changelog
-    except Exception:
-        pass
-
-    return True
+    return SETTINGS.changelog_hash != current_hash
 
 def mark_changelog_shown():
     """Mark the current changelog as shown by saving its hash."""
-    try:
-        current_hash = hashlib.md5(CHANGELOG.encode('utf-8')).hexdigest()
-        os.makedirs(os.path.dirname(CHANGELOG_HASH_FILE), exist_ok=True)
-        with open(CHANGELOG_HASH_FILE, 'w') as f:
-            f.write(current_hash)
-    except Exception:
-        pass
+    SETTINGS.changelog_hash = hashlib.md5(CHANGELOG.encode('utf-8')).hexdigest()
 
 # Safe exit function that properly releases KMS/DRM resources
 def clean_exit(code=0):
+    HISTORY.flush()
+    SETTINGS.flush()
+    STATE.close()
+    save_startup_snapshot()
     pygame.display.quit()
     pygame.quit()
     sys.exit(code)
 
+screen = None
+W, H = 1280, 720
+UI_SCALE = 1.0
+clock = None
+
 # Safe display initialization that never corrupts the Batocera framebuffer
 def init_display():
     global screen, W, H, UI_SCALE
@@ -806,21 +2656,92 @@ def init_display():
 def S(n: int) -> int:
     return int(round(n * UI_SCALE))
 
-init_display()
-clock = pygame.time.Clock()
+# ---------- Fonts ----------
+# SysFont() walks the system font registry (fc-list) on every call, which can
+# take hundreds of milliseconds on Batocera. Resolved font file paths are
+# cached on disk, and Font objects are pooled per (family, size, bold).
+FONT_PATH_CACHE_FILE = "/userdata/system/add-ons/bua_font_paths.json"
+UI_FONT_FAMILY = "DejaVu Sans"
 
+_FONT_PATHS: Dict[str, str] = {}  # "family|bold" -> font file ("" = not found)
+_FONT_PATHS_LOADED = False
+_FONT_POOL: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+def _font_key(family: str, bold: bool) -> str:
+    return f"{family.lower().replace(' ', '')}|{'bold' if bold else 'regular'}"
+
+def _load_font_path_cache():
+    global _FONT_PATHS_LOADED
+    _FONT_PATHS_LOADED = True
+    try:
+        with open(FONT_PATH_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            # Drop entries whose file has gone away (font package updated)
+            _FONT_PATHS.update({k: v for k, v in data.items() if v and os.path.exists(v)})
+    except Exception:
+        pass
+
+def _save_font_path_cache():
+    try:
+        os.makedirs(os.path.dirname(FONT_PATH_CACHE_FILE), exist_ok=True)
+        tmp = FONT_PATH_CACHE_FILE + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({k: v for k, v in _FONT_PATHS.items() if v}, f, indent=2)
+        os.replace(tmp, FONT_PATH_CACHE_FILE)
+    except Exception:
+        pass
+
+def resolve_font_path(family: str, bold: bool = False) -> str | None:
+    """Font file for a family, from the path cache or a one-time registry lookup."""
+    if not _FONT_PATHS_LOADED:
+        _load_font_path_cache()
+    key = _font_key(family, bold)
+    if key not in _FONT_PATHS:
+        with trace_span("match_font", family=family, bold=bold):
+            path = pygame.font.match_font(family.lower().replace(" ", ""), bold=bold) or ""
+        _FONT_PATHS[key] = path
+        if path:
+            _save_font_path_cache()
+    return _FONT_PATHS[key] or None
+
+def get_font(family: str | None, size: int, bold: bool = False) -> pygame.font.Font:
+    """Pooled Font object; family None is pygame's default font."""
+    pool_key = (family or "", size, bold)
+    font = _FONT_POOL.get(pool_key)
+    if font is not None:
+        return font
+    if family is None:
+        font = pygame.font.Font(None, size)
+    else:
+        path = resolve_font_path(family, bold)
+        if bold and not path:
+            path = resolve_font_path(family)
+            synthetic_bold = bool(path)
+        else:
+            synthetic_bold = False
+        if path:
+            font = pygame.font.Font(path, size)
+            if synthetic_bold:
+                font.set_bold(True)
+        else:
+            # Not installed under that name: let SysFont pick its fallback
+            font = pygame.font.SysFont(family, size, bold=bold)
+    _FONT_POOL[pool_key] = font
+    return font
+
+@traced("load_fonts")
 def load_fonts():
     # DejaVu Sans for primary UI - good Latin/Cyrillic/Greek coverage
     # Note: DejaVu Sans doesn't support Arabic, Hebrew, CJK, Indic scripts
     # Those will show as squares in language names, but that's acceptable
     # since we show "English (Native)" format anyway
-
-    primary = pygame.font.SysFont("DejaVu Sans", 24)
-    small = pygame.font.SysFont("DejaVu Sans", 18)
-    big = pygame.font.SysFont("DejaVu Sans", 36, bold=True)
+    primary = get_font(UI_FONT_FAMILY, 24)
+    small = get_font(UI_FONT_FAMILY, 18)
+    big = get_font(UI_FONT_FAMILY, 36, bold=True)
     return primary, small, big
 
-FONT, FONT_SMALL, FONT_BIG = load_fonts()
+FONT = FONT_SMALL = FONT_BIG = None  # set by boot()
 
 # Batocera brand-inspired palette
 # Dark slate background, slate cards, cyan-blue accents
@@ -833,6 +2754,7 @@ SELECT = (0, 120, 180)
 
 # ---------- Assets & Background ----------
 LOGO_SURF = None
+LOGO_HASH = ""  # sha1 of the logo image bytes, part of the background cache key
 WHEEL_SURF = None
 BACKGROUND_SURF = None  # Will be created in init_assets()
 BUTTON_ICONS: Dict[str, pygame.Surface] = {}
@@ -895,19 +2817,8 @@ def update_button_mapping():
 # Optional: manual button mapper
 # ------------------------------
 
-# Where to persist a manual button map
-CONTROLS_FILE = "/userdata/system/add-ons/bua_controls.json"
-
 def _load_saved_button_map() -> dict:
-    try:
-        if os.path.exists(CONTROLS_FILE):
-            with open(CONTROLS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f) or {}
-                if isinstance(data, dict):
-                    return data
-    except Exception:
-        pass
-    return {}
+    return SETTINGS.button_map
 
 def _apply_saved_button_map_if_any() -> bool:
     """If a manual mapping exists, apply it by setting env vars and updating globals.
@@ -932,12 +2843,7 @@ def _apply_saved_button_map_if_any() -> bool:
     return False
 
 def _save_button_map(mapping: dict) -> None:
-    try:
-        os.makedirs(os.path.dirname(CONTROLS_FILE), exist_ok=True)
-        with open(CONTROLS_FILE, "w", encoding="utf-8") as f:
-            json.dump(mapping, f, indent=2)
-    except Exception:
-        pass
+    SETTINGS.button_map = mapping
 
 def run_manual_button_mapper() -> bool:
     """Blocking mini-wizard to manually map controller buttons.
@@ -1060,39 +2966,229 @@ def _try_load(path: str):
     except Exception:
         return None
 
+# ---------- Asset cache ----------
+# Downloaded images are kept on disk keyed by URL so warm starts load every
+# icon locally. Entries older than ASSET_REVALIDATE_AGE are served from disk
+# and revalidated in the background with ETag / Last-Modified. 404s are
+# remembered for ASSET_NEGATIVE_TTL so missing name patterns cost nothing.
+ASSET_CACHE_DIR = "/userdata/system/add-ons/bua_asset_cache"
+ASSET_CACHE_INDEX = os.path.join(ASSET_CACHE_DIR, "index.json")
+ASSET_REVALIDATE_AGE = 24 * 3600
+ASSET_NEGATIVE_TTL = 7 * 24 * 3600
+ASSET_FETCH_WORKERS = 8
+
+_ASSET_INDEX: Dict[str, dict] | None = None
+_ASSET_INDEX_LOCK = threading.Lock()
+_ASSET_INDEX_SAVE_LOCK = threading.Lock()
+_ASSET_INDEX_DIRTY = False
+# url -> bytes (None when unavailable), filled by prefetch_assets()
+ASSET_BYTES: Dict[str, bytes | None] = {}
+
+def _asset_index() -> Dict[str, dict]:
+    global _ASSET_INDEX
+    with _ASSET_INDEX_LOCK:
+        if _ASSET_INDEX is None:
+            _ASSET_INDEX = {}
+            try:
+                if os.path.exists(ASSET_CACHE_INDEX):
+                    with open(ASSET_CACHE_INDEX, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        _ASSET_INDEX = data
+            except Exception as e:
+                print(f"[BUA] Could not load asset cache index: {e}")
+        return _ASSET_INDEX
+
+def _asset_cache_path(url: str) -> str:
+    return os.path.join(ASSET_CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+def _asset_index_update(url: str, entry: dict):
+    global _ASSET_INDEX_DIRTY
+    index = _asset_index()
+    with _ASSET_INDEX_LOCK:
+        index[url] = entry
+        _ASSET_INDEX_DIRTY = True
+
+def save_asset_index():
+    """Write the asset cache index to disk if it changed"""
+    global _ASSET_INDEX_DIRTY
+    # Prefetch workers and revalidation save concurrently; one save at a time
+    # keeps an older snapshot from replacing a newer one
+    with _ASSET_INDEX_SAVE_LOCK:
+        with _ASSET_INDEX_LOCK:
+            if not _ASSET_INDEX_DIRTY or _ASSET_INDEX is None:
+                return
+            snapshot = dict(_ASSET_INDEX)
+            _ASSET_INDEX_DIRTY = False
+        try:
+            _atomic_write_json(ASSET_CACHE_INDEX, snapshot)
+        except Exception as e:
+            with _ASSET_INDEX_LOCK:
+                _ASSET_INDEX_DIRTY = True
+            print(f"[BUA] Could not save asset cache index: {e}")
+
+def _download_asset(url: str, entry: dict | None) -> bytes | None:
+    """Fetch url (conditionally if we have validators) and update the cache"""
+    entry = entry or {}
+    status, data, validators = fetch_url_conditional(
+        url,
+        headers={"User-Agent": "BUA-Icons"},
+        etag=entry.get("etag") if entry.get("status") == 200 else None,
+        last_modified=entry.get("last_modified") if entry.get("status") == 200 else None,
+        timeout=5,
+    )
+    now = time.time()
+    path = _asset_cache_path(url)
+    if status == 304:
+        _asset_index_update(url, dict(entry, checked=now))
+        with open(path, "rb") as f:
+            return f.read()
+    if status == 200 and data:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        _asset_index_update(url, {"status": 200, "checked": now, **validators})
+        return data
+    if status in (403, 404, 410):
+        _asset_index_update(url, {"status": status, "checked": now})
+    return None
+
+def _revalidate_assets(items: List[Tuple[str, dict]]):
+    for url, entry in items:
+        try:
+            _download_asset(url, entry)
+        except Exception:
+            pass
+    save_asset_index()
+
+def fetch_asset_bytes(url: str) -> bytes | None:
+    """Return the bytes for an asset URL, from the disk cache when possible"""
+    entry = _asset_index().get(url)
+    if entry:
+        age = time.time() - entry.get("checked", 0)
+        if entry.get("status") != 200 and age < ASSET_NEGATIVE_TTL:
+            return None
+        if entry.get("status") == 200:
+            try:
+                with open(_asset_cache_path(url), "rb") as f:
+                    return f.read()
+            except Exception:
+                entry = None
+    try:
+        return _download_asset(url, entry)
+    except Exception:
+        # Network problems are not cached - try again next launch
+        return None
+
+@traced("prefetch_assets", "assets")
+def prefetch_assets(urls: List[str]):
+    """Resolve all candidate asset URLs concurrently into ASSET_BYTES"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending = [u for u in dict.fromkeys(urls) if u and u not in ASSET_BYTES]
+    if not pending:
+        return
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=ASSET_FETCH_WORKERS) as pool:
+        for url, data in zip(pending, pool.map(fetch_asset_bytes, pending)):
+            ASSET_BYTES[url] = data
+    found = sum(1 for u in pending if ASSET_BYTES.get(u))
+    print(f"[BUA] Resolved {found}/{len(pending)} assets in {(time.monotonic() - started) * 1000:.0f} ms")
+
+    # Refresh stale entries for the next launch without holding up this one
+    now = time.time()
+    index = _asset_index()
+    stale = [(u, index[u]) for u in pending
+             if u in index and index[u].get("status") == 200
+             and now - index[u].get("checked", 0) >= ASSET_REVALIDATE_AGE]
+    if stale:
+        threading.Thread(target=_revalidate_assets, args=(stale,), daemon=True).start()
+    save_asset_index()
+
+def _asset_url(name: str) -> str:
+    return DEFAULT_BUTTONS_BASE_URL.rstrip("/") + "/" + name
+
+# File name patterns tried for hosted/local button icons
+BUTTON_NAME_PATTERNS = [
+    "btn_{k}.png",
+    "button_{k}.png",
+    "{k}.png",
+    "abxy_{k}.png",
+]
+PS_BUTTON_FILES = {
+    "cross": "btn_cro.png",
+    "circle": "btn_cir.png",
+    "square": "btn_squ.png",
+    "triangle": "btn_tri.png",
+}
+PS_BUTTON_NAME_PATTERNS = [
+    "ps_{k}.png",
+    "playstation_{k}.png",
+    "button_{k}.png",
+]
+BACK_BUTTON_FILES = [
+    "btn_sel.png",
+    "select.png",
+    "btn_back.png",
+    "back.png",
+]
+
+def asset_candidate_urls() -> List[str]:
+    """Every remote URL init_assets() may try, in the order it tries them"""
+    urls = [os.environ.get(f"BUA_BTN_{k}_URL") for k in ("A", "B", "X", "Y", "CROSS", "CIRCLE", "SQUARE", "TRIANGLE")]
+    if DEFAULT_BUTTONS_BASE_URL:
+        urls.append(_asset_url("batocera-unofficial-addons.png"))
+        urls.append(_asset_url("batocera-unofficial-addons-wheel.png"))
+        for key in ("a", "b", "x", "y"):
+            for name in [f"btn_{key.upper()}.png", f"btn-{key.upper()}.png"] + BUTTON_NAME_PATTERNS:
+                urls.append(_asset_url(name.format(k=key)))
+        for key, fname in PS_BUTTON_FILES.items():
+            urls.append(_asset_url(fname))
+            urls.extend(_asset_url(p.format(k=key)) for p in PS_BUTTON_NAME_PATTERNS)
+        urls.append(_asset_url("play-button.png"))
+        urls.extend(_asset_url(n) for n in BACK_BUTTON_FILES)
+        urls.append(_asset_url("btn_lb.png"))
+        urls.append(_asset_url("btn_rb.png"))
+    return [u for u in urls if u]
+
 
 def _from_url(url: str | None, verbose: bool = False):
     """
-    Download image from URL.
+    Load image from URL, using prefetched bytes or the asset cache.
     Set verbose=True to print error messages (useful for critical resources).
     By default, errors are silent since this is often used with fallback URLs.
     """
     if not url:
         return None
     try:
-        data = fetch_url_with_retry(
-            url,
-            headers={"User-Agent": "BUA-Icons"},
-            timeout=5,
-            retries=0  # No retries for icons - fail fast and try next fallback
-        )
+        data = ASSET_BYTES[url] if url in ASSET_BYTES else fetch_asset_bytes(url)
+        if data is None:
+            return None
         if verbose:
-            print(f"[BUA] Successfully downloaded: {url}")
+            print(f"[BUA] Successfully loaded: {url}")
         return pygame.image.load(io.BytesIO(data)).convert_alpha()
     except Exception:
         # Silent failure - this is expected when trying multiple fallback URLs
         return None
 
+@traced("init_assets", "assets")
 def init_assets():
-    global LOGO_SURF, WHEEL_SURF, BACKGROUND_SURF, BUTTON_ICONS
+    global LOGO_SURF, LOGO_HASH, WHEEL_SURF, BACKGROUND_SURF, BUTTON_ICONS
     LOGO_SURF = None
+    LOGO_HASH = ""
     WHEEL_SURF = None
     BUTTON_ICONS = {}
+    # Resolve every remote candidate at once (cache first, then network)
+    prefetch_assets(asset_candidate_urls())
     # Preferred watermark/background logo (try hosted first)
     if DEFAULT_BUTTONS_BASE_URL:
-        remote_logo = _from_url(DEFAULT_BUTTONS_BASE_URL.rstrip("/") + "/batocera-unofficial-addons.png")
+        logo_url = _asset_url("batocera-unofficial-addons.png")
+        remote_logo = _from_url(logo_url)
         if remote_logo is not None:
             LOGO_SURF = remote_logo
+            LOGO_HASH = hashlib.sha1(ASSET_BYTES.get(logo_url) or b"").hexdigest()
     if LOGO_SURF is None:
         logo_candidates = [
             os.path.join(os.sep, "images", "BatoceraUnofficialAddons.png"),
@@ -1107,6 +3203,7 @@ def init_assets():
                 surf = _try_load(p)
                 if surf is not None:
                     LOGO_SURF = surf
+                    LOGO_HASH = _file_sha1(p)
                     break
 
     # Top bar text-replacement (Wheel) image
@@ -1146,12 +3243,7 @@ def init_assets():
         "assets",
         os.curdir,
     ]
-    name_patterns = [
-        "btn_{k}.png",
-        "button_{k}.png",
-        "{k}.png",
-        "abxy_{k}.png",
-    ]
+    name_patterns = BUTTON_NAME_PATTERNS
     for key in ("a", "b", "x", "y"):
         if key.upper() in BUTTON_ICONS:
             continue
@@ -1209,17 +3301,8 @@ def init_assets():
     # common base URL
     if DEFAULT_BUTTONS_BASE_URL:
         # Exact names from the provided repo
-        direct_map = {
-            "cross": "btn_cro.png",
-            "circle": "btn_cir.png",
-            "square": "btn_squ.png",
-            "triangle": "btn_tri.png",
-        }
-        ps_name_patterns = [
-            "ps_{k}.png",
-            "playstation_{k}.png",
-            "button_{k}.png",
-        ]
+        direct_map = PS_BUTTON_FILES
+        ps_name_patterns = PS_BUTTON_NAME_PATTERNS
         for key in ["cross", "circle", "square", "triangle"]:
             kU = key.upper()
             if kU in BUTTON_ICONS:
@@ -1289,12 +3372,7 @@ def init_assets():
 
     # Load Back/Select icon if available (e.g., btn_sel.png on the hosted repo)
     if "BACK" not in BUTTON_ICONS:
-        back_candidates = [
-            "btn_sel.png",
-            "select.png",
-            "btn_back.png",
-            "back.png",
-        ]
+        back_candidates = BACK_BUTTON_FILES
         back_surf = None
         # Try hosted first
         if DEFAULT_BUTTONS_BASE_URL:
@@ -1342,28 +3420,118 @@ def init_assets():
             if rb_surf is not None:
                 BUTTON_ICONS["RB"] = rb_surf
 
-    # Build a textured background once
-    BACKGROUND_SURF = pygame.Surface((W, H)).convert()
-    BACKGROUND_SURF.fill(BG)
+    # Build the textured background (or load it precomposed from disk)
+    BACKGROUND_SURF = build_background(W, H)
+
+# ---------- Background cache ----------
+# The composed background only depends on the screen size, the logo and the
+# theme, so it is stored as raw RGB pixels and loaded back in a single read.
+BACKGROUND_CACHE_DIR = "/userdata/system/add-ons/bua_background_cache"
+BACKGROUND_CACHE_KEEP = 3  # number of resolutions kept on disk
+BACKGROUND_STYLE_VERSION = 1  # bump when the gradient/vignette/tint changes
+
+def _file_sha1(path: str) -> str:
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except Exception:
+        return ""
+
+def _background_cache_path(w: int, h: int) -> str:
+    key = f"{BACKGROUND_STYLE_VERSION}|{w}x{h}|{LOGO_HASH}|{BG}"
+    return os.path.join(BACKGROUND_CACHE_DIR, f"bg_{w}x{h}_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.rgb")
+
+def _load_background_cache(path: str, w: int, h: int):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) != w * h * 3:
+            return None
+        return pygame.image.frombuffer(data, (w, h), "RGB").convert()
+    except Exception:
+        return None
+
+def _save_background_cache(path: str, surf):
+    try:
+        os.makedirs(BACKGROUND_CACHE_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(pygame.image.tostring(surf, "RGB"))
+        os.replace(tmp, path)
+        # Keep only the most recently used resolutions
+        files = [os.path.join(BACKGROUND_CACHE_DIR, n) for n in os.listdir(BACKGROUND_CACHE_DIR) if n.endswith(".rgb")]
+        files.sort(key=os.path.getmtime, reverse=True)
+        for old in files[BACKGROUND_CACHE_KEEP:]:
+            os.remove(old)
+    except Exception as e:
+        print(f"[BUA] Could not save background cache: {e}")
+
+def _shade_background(w: int, h: int):
+    """Fill with BG, then apply the vertical gradient and vignette using NumPy.
+    Returns None if surfarray/NumPy are unavailable."""
+    try:
+        import numpy as np
+        surf = pygame.Surface((w, h)).convert()
+        pixels = pygame.surfarray.pixels3d(surf)
+    except Exception:
+        return None
+    # Remaining brightness per pixel; gradient darkens towards the bottom
+    rows = (40 * np.arange(h, dtype=np.float32) / h).astype(np.int32)
+    shade = np.empty((w, h), dtype=np.float32)
+    shade[:] = 1.0 - rows[None, :] / 255.0
+    # Vignette rings (3px wide); skipped when every ring is off-screen
+    steps = 10
+    r_min = int(max(w, h) * 0.6)
+    if r_min - 3 < ((w / 2) ** 2 + (h / 2) ** 2) ** 0.5:
+        xs = np.arange(w, dtype=np.float32) - w // 2
+        ys = np.arange(h, dtype=np.float32) - h // 2
+        dist = np.hypot(xs[:, None], ys[None, :])
+        for s in range(steps):
+            r = int(max(w, h) * (0.6 + 0.4 * s / steps))
+            alpha = int(12 + 22 * s / steps)
+            shade[(dist > r - 3) & (dist <= r)] *= 1.0 - alpha / 255.0
+        del dist
+    for c in range(3):
+        pixels[:, :, c] = (BG[c] * shade).astype(np.uint8)
+    del pixels  # unlock the surface
+    return surf
+
+def _draw_background_layers(w: int, h: int):
+    """Per-line fallback for builds without NumPy"""
+    surf = pygame.Surface((w, h)).convert()
+    surf.fill(BG)
     # Subtle vertical gradient
-    grad = pygame.Surface((W, H), pygame.SRCALPHA)
-    for i in range(H):
-        a = int(40 * (i / H))
-        pygame.draw.line(grad, (0, 0, 0, a), (0, i), (W, i))
-    BACKGROUND_SURF.blit(grad, (0, 0))
+    grad = pygame.Surface((w, h), pygame.SRCALPHA)
+    for i in range(h):
+        a = int(40 * (i / h))
+        pygame.draw.line(grad, (0, 0, 0, a), (0, i), (w, i))
+    surf.blit(grad, (0, 0))
     # Vignette
-    vignette = pygame.Surface((W, H), pygame.SRCALPHA)
+    vignette = pygame.Surface((w, h), pygame.SRCALPHA)
     steps = 10
     for s in range(steps):
-        r = int(max(W, H) * (0.6 + 0.4 * s / steps))
+        r = int(max(w, h) * (0.6 + 0.4 * s / steps))
         alpha = int(12 + 22 * s / steps)
-        pygame.draw.circle(vignette, (0, 0, 0, alpha), (W // 2, H // 2), r, width=3)
-    BACKGROUND_SURF.blit(vignette, (0, 0))
+        pygame.draw.circle(vignette, (0, 0, 0, alpha), (w // 2, h // 2), r, width=3)
+    surf.blit(vignette, (0, 0))
+    return surf
+
+@traced("build_background", "assets")
+def build_background(w: int, h: int):
+    """Return the full-screen background, from the disk cache when possible"""
+    path = _background_cache_path(w, h)
+    cached = _load_background_cache(path, w, h)
+    if cached is not None:
+        return cached
+
+    surf = _shade_background(w, h)
+    if surf is None:
+        surf = _draw_background_layers(w, h)
     # Large logo background, centered and filling the whole screen
     if LOGO_SURF is not None:
         try:
             # Scale-to-cover (fill), keep aspect ratio, center
-            cover_scale = max(W / LOGO_SURF.get_width(), H / LOGO_SURF.get_height())
+            cover_scale = max(w / LOGO_SURF.get_width(), h / LOGO_SURF.get_height())
             new_w = max(1, int(LOGO_SURF.get_width() * cover_scale))
             new_h = max(1, int(LOGO_SURF.get_height() * cover_scale))
             wm = pygame.transform.smoothscale(LOGO_SURF, (new_w, new_h)).convert_alpha()
@@ -1371,9 +3539,11 @@ def init_assets():
             tint = pygame.Surface(wm.get_size(), pygame.SRCALPHA)
             tint.fill((0, 0, 0, 210))
             wm.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
-            BACKGROUND_SURF.blit(wm, ((W - wm.get_width()) // 2, (H - wm.get_height()) // 2))
+            surf.blit(wm, ((w - wm.get_width()) // 2, (h - wm.get_height()) // 2))
         except Exception:
             pass
+    _save_background_cache(path, surf)
+    return surf
 
 def draw_background(surf):
     if BACKGROUND_SURF is not None:
@@ -1397,12 +3567,18 @@ def handle_resize(new_w: int, new_h: int):
     FONT, FONT_SMALL, FONT_BIG = load_fonts()
     init_assets()
 
-# Controller support
-pygame.joystick.init()
-JOYS = [pygame.joystick.Joystick(i) for i in range(pygame.joystick.get_count())]
-for j in JOYS:
-    j.init()
-LAST_JOY_COUNT = pygame.joystick.get_count()
+# Controller support (handles are opened by init_joysticks() during boot)
+JOYS: List = []
+LAST_JOY_COUNT = 0
+
+@traced("init_joysticks")
+def init_joysticks():
+    global JOYS, LAST_JOY_COUNT
+    pygame.joystick.init()
+    JOYS = [pygame.joystick.Joystick(i) for i in range(pygame.joystick.get_count())]
+    for j in JOYS:
+        j.init()
+    LAST_JOY_COUNT = pygame.joystick.get_count()
 
 # Analog stick support for navigation (for arcade cabinets without dpad)
 ANALOG_DEADZONE = 0.5  # Threshold for detecting stick movement
@@ -1444,9 +3620,7 @@ def detect_pad_style() -> str:
     return "keyboard" if pygame.joystick.get_count() == 0 else "xbox"
 
 
-# Decide pad style (updates dynamically on connect/disconnect)
-PAD_STYLE = detect_pad_style()
-update_button_mapping()
+# Pad style is detected in boot() and updated on connect/disconnect
 
 def input_style_label() -> str:
     """Return a concise label of the current input device.
@@ -1775,6 +3949,155 @@ def draw_persistent_hints(surf) -> None:
     """Draw persistent hints - currently disabled as hints are shown inline on each screen."""
     pass
 
+# ------------------------------
+# Install performance records
+# ------------------------------
+# Every install/uninstall job records how long it took and what it cost:
+# bytes received over the network (all interfaces but lo, so other traffic
+# in the same window counts too), bytes written to storage and CPU time (both
+# from the rusage of child processes reaped meanwhile; jobs run one at a time)
+# and the peak resident memory of the job's process tree (sampled from /proc). Stored in the state database, or in
+# bua_install_perf.jsonl without it, and exportable as a CSV report.
+
+INSTALL_PERF_FILE = "/userdata/system/add-ons/bua_install_perf.jsonl"
+INSTALL_REPORT_FILE = "/userdata/system/add-ons/bua_install_report.csv"
+PERF_SAMPLE_INTERVAL = 0.5  # seconds between /proc memory samples
+INSTALL_PERF_FIELDS = [
+    "app", "action", "started", "duration", "exit_code", "success",
+    "net_rx_bytes", "disk_write_bytes", "cpu_user", "cpu_system", "peak_rss",
+]
+
+def usage_counters() -> Dict[str, float]:
+    """Cumulative counters that a job's cost is measured against (deltas are taken)."""
+    counters = {"rx": 0, "written": 0, "cpu_user": 0.0, "cpu_system": 0.0}
+    try:
+        with open("/proc/net/dev", "r") as f:
+            for line in f.readlines()[2:]:
+                name, data = line.split(":", 1)
+                if name.strip() != "lo":
+                    counters["rx"] += int(data.split()[0])
+    except (OSError, ValueError):
+        pass
+    try:
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        counters["cpu_user"], counters["cpu_system"] = usage.ru_utime, usage.ru_stime
+        # Linux reports the children's write_bytes (from /proc/<pid>/io) in 512-byte units
+        counters["written"] = usage.ru_oublock * 512
+    except Exception:
+        pass
+    return counters
+
+def process_tree_rss(root_pid: int) -> int:
+    """Resident memory in bytes of a process and all of its descendants."""
+    children: Dict[int, List[int]] = {}
+    rss: Dict[int, int] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        pid = int(entry)
+        children.setdefault(int(fields[1]), []).append(pid)  # fields[1] = ppid
+        rss[pid] = int(fields[21])                            # fields[21] = rss in pages
+    total, todo = 0, [root_pid]
+    while todo:
+        pid = todo.pop()
+        total += rss.get(pid, 0)
+        todo.extend(children.get(pid, ()))
+    return total * os.sysconf("SC_PAGE_SIZE")
+
+def record_install_perf(app_name: str, action: str, runner: "Runner"):
+    """Store the metrics of a finished job (written by STATE_WRITER)."""
+    if not runner.metrics:
+        return
+    record = dict(runner.metrics, app=app_name, action=action, success=runner.returncode == 0)
+    STATE_WRITER.submit(lambda: _write_install_perf(record))
+
+def _write_install_perf(record: dict):
+    try:
+        if STATE.available():
+            STATE.execute(
+                f"INSERT INTO install_perf ({', '.join(INSTALL_PERF_FIELDS)}) "
+                f"VALUES ({', '.join('?' * len(INSTALL_PERF_FIELDS))})",
+                [int(record[k]) if isinstance(record[k], bool) else record[k] for k in INSTALL_PERF_FIELDS],
+            )
+        else:
+            os.makedirs(os.path.dirname(INSTALL_PERF_FILE), exist_ok=True)
+            with open(INSTALL_PERF_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps({k: record[k] for k in INSTALL_PERF_FIELDS}) + "\n")
+    except Exception as e:
+        print(f"[BUA] Failed to record install metrics: {e}")
+
+def install_perf_records(app_name: str | None = None, limit: int = 0) -> List[dict]:
+    """Stored job metrics, newest first, optionally for one app only."""
+    STATE_WRITER.flush()
+    try:
+        if STATE.available():
+            sql = f"SELECT {', '.join(INSTALL_PERF_FIELDS)} FROM install_perf"
+            params: tuple = ()
+            if app_name is not None:
+                sql += " WHERE app = ?"
+                params = (app_name,)
+            sql += " ORDER BY id DESC"
+            if limit:
+                sql += f" LIMIT {int(limit)}"
+            records = [dict(zip(INSTALL_PERF_FIELDS, row)) for row in STATE.query(sql, params)]
+        else:
+            records = []
+            if os.path.exists(INSTALL_PERF_FILE):
+                with open(INSTALL_PERF_FILE, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except ValueError:
+                            continue
+                        if app_name is None or record.get("app") == app_name:
+                            records.append(record)
+            records.reverse()
+            if limit:
+                records = records[:limit]
+    except Exception as e:
+        print(f"[BUA] Failed to read install metrics: {e}")
+        return []
+    for record in records:
+        record["success"] = bool(record.get("success"))
+    return records
+
+def export_install_report(path: str = INSTALL_REPORT_FILE) -> str | None:
+    """Write every stored record to a CSV file. Returns the path, or None on failure."""
+    import csv
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=INSTALL_PERF_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(reversed(install_perf_records()))
+        os.replace(tmp, path)
+        return path
+    except Exception as e:
+        print(f"[BUA] Failed to export install report: {e}")
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        return None
+
+def format_install_perf(record: dict) -> str:
+    """One-line summary of a record for on-screen lists."""
+    mb = 1024 * 1024
+    return (
+        f"{record.get('started', '')}  {record.get('action', '')} "
+        f"{'OK' if record.get('success') else 'FAILED (' + str(record.get('exit_code')) + ')'}  "
+        f"{record.get('duration', 0):.1f} s  "
+        f"rx {record.get('net_rx_bytes', 0) / mb:.1f} MB  "
+        f"written {record.get('disk_write_bytes', 0) / mb:.1f} MB  "
+        f"cpu {record.get('cpu_user', 0) + record.get('cpu_system', 0):.1f} s  "
+        f"peak {record.get('peak_rss', 0) / mb:.0f} MB"
+    )
+
 # ------------------------------
 # Process runner with live log
 # ------------------------------
@@ -1797,6 +4120,7 @@ class Runner:
         self.last_line: str = ""  # Track previous line for context
         self.menu_request: dict | None = None  # Menu selection request
         self.menu_response: str | None = None  # User's menu selection response
+        self.metrics: dict | None = None  # Cost of the finished job (see record_install_perf)
 
     def append(self, text: str):
         with self.lock:
@@ -1908,33 +4232,68 @@ class Runner:
                 if len(self.lines) > 1000:
                     self.lines = self.lines[-1000:]
 
-    def run(self, cmd: str):
+    def run(self, cmd: str) -> bool:
+        """Start cmd in the background. Returns False (nothing started) while
+        another job holds INSTALL_LOCK; the lock is held until cmd exits."""
+        if not INSTALL_LOCK.acquire(blocking=False):
+            return False
         # Execute the command and wait for completion
         # Add 'wait' to ensure all background processes finish
         full_cmd = f"({cmd}); wait"
 
-        self.proc = subprocess.Popen(
-            ["bash", "-c", full_cmd],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
-        )
+        started = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        start_time = time.monotonic()
+        before = usage_counters()
+        peak_rss = [0]
+        try:
+            self.proc = subprocess.Popen(
+                ["bash", "-c", full_cmd],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+            )
+        except Exception:
+            INSTALL_LOCK.release()
+            raise
         def reader():
             assert self.proc and self.proc.stdout
             output_lines = []
-            for line in self.proc.stdout:
-                stripped = line.rstrip("\n")
-                self.append(stripped)
-                output_lines.append(stripped)
-            self.proc.wait()
+            try:
+                for line in self.proc.stdout:
+                    stripped = line.rstrip("\n")
+                    self.append(stripped)
+                    output_lines.append(stripped)
+                self.proc.wait()
+            finally:
+                INSTALL_LOCK.release()
+            after = usage_counters()
+            self.metrics = {
+                "started": started,
+                "duration": round(time.monotonic() - start_time, 3),
+                "exit_code": self.proc.returncode,
+                "net_rx_bytes": after["rx"] - before["rx"],
+                "disk_write_bytes": after["written"] - before["written"],
+                "cpu_user": round(after["cpu_user"] - before["cpu_user"], 3),
+                "cpu_system": round(after["cpu_system"] - before["cpu_system"], 3),
+                "peak_rss": peak_rss[0],
+            }
             self.returncode = self.proc.returncode
             # Store last 10 lines for error display
             self.error_output = "\n".join(output_lines[-10:])
             self.done = True
+        def sampler():
+            while self.proc.poll() is None:
+                try:
+                    peak_rss[0] = max(peak_rss[0], process_tree_rss(self.proc.pid))
+                except Exception:
+                    pass
+                time.sleep(PERF_SAMPLE_INTERVAL)
         t = threading.Thread(target=reader, daemon=True)
         t.start()
+        threading.Thread(target=sampler, name="bua-job-sampler", daemon=True).start()
+        return True
 
     def kill(self):
         if self.proc and self.proc.poll() is None:
@@ -1964,28 +4323,11 @@ class MenuScreen(BaseScreen):
         self.all_items = list(items)
         self.items = list(items)
         self.idx = 0
-        self.stats = self.calculate_stats() if title == "Batocera Unofficial Add-Ons" else None
+        self.stats = INSTALL_STATS.get() if title == "Batocera Unofficial Add-Ons" else None
         self.search_mode = False
         self.search_query = ""
         self.keyboard = OnScreenKeyboard()
 
-    def calculate_stats(self):
-        """Calculate installation statistics"""
-        history = load_history()
-        total_installed = len([k for k in history if any(e['success'] for e in history[k])])
-        
-        # Count by category
-        category_stats = {}
-        for cat_name, app_list in CATEGORIES.items():
-            installed = sum(1 for app in app_list if is_installed(app))
-            category_stats[cat_name] = (installed, len(app_list))
-        
-        return {
-            'total_installed': total_installed,
-            'total_available': len(APPS),
-            'category_stats': category_stats
-        }
-
     def handle(self, events):
         # If in search mode, route input to on-screen keyboard
         if self.search_mode:
@@ -1998,13 +4340,8 @@ class MenuScreen(BaseScreen):
                     q = self.search_query.lower().strip()
                     self.search_mode = False
                     if q:
-                        # Gather matches across all categories/apps
-                        def matches(k: str) -> bool:
-                            if q in k.lower():
-                                return True
-                            return q in DESCRIPTIONS.get(k, "").lower()
-                        all_keys = sorted(APPS.keys())
-                        results = [k for k in all_keys if matches(k)]
+                        # Ranked matches across all categories/apps
+                        results = SEARCH_INDEX.search(q)
                         if results:
                             push_screen(GlobalSearchScreen(query=self.search_query, app_keys=results))
                         else:
@@ -2078,15 +4415,6 @@ class MenuScreen(BaseScreen):
 
     def activate(self):
         name, _desc = self.items[self.idx]
-        # Map translated names back to English category keys
-        category_map = {
-            t("games"): "Games",
-            t("windows_freeware"): "Windows Freeware",
-            t("game_utilities"): "Game Utilities",
-            t("system_utilities"): "System Utilities",
-            t("developer_tools"): "Developer Tools",
-            t("docker_menu"): "Docker Menu",
-        }
 
         if name == t("exit"):
             clean_exit(0)
@@ -2101,7 +4429,7 @@ class MenuScreen(BaseScreen):
             push_screen(UpdaterScreen())
             return
         # category -> check list screen
-        english_name = category_map.get(name, name)
+        english_name = category_for_label(name)
         if english_name in CATEGORIES:
             apps = sorted(CATEGORIES[english_name])
             push_screen(ChecklistScreen(category=name, app_keys=apps))
@@ -2146,24 +4474,15 @@ class MenuScreen(BaseScreen):
         if self.stats:
             # Place stats under the header/banner
             stats_y = header_y + header_h + S(12)
-            total_text = (
-                f"{t('installed')}: {self.stats['total_installed']} {t('of')} {self.stats['total_available']} {t('addons')}"
-                f"  |  A={t('hint_open')}  |  X={t('hint_search')}  |  Back={t('hint_back_settings')}  |  {t('input')}: {input_style_label()}"
-            )
+            installed, available, style = self.stats['total_installed'], self.stats['total_available'], input_style_label()
+            total_text = ui_text(("menu_stats", installed, available, style), lambda: (
+                f"{t('installed')}: {installed} {t('of')} {available} {t('addons')}"
+                f"  |  A={t('hint_open')}  |  X={t('hint_search')}  |  Back={t('hint_back_settings')}  |  {t('input')}: {style}"
+            ))
             draw_hints_line(screen, total_text, FONT_SMALL, ACCENT, (S(40), stats_y))
 
         list_y = (stats_y + S(35)) if self.stats else (header_y + header_h + S(20))
 
-        # Create reverse mapping from translated to English category names
-        category_map = {
-            t("games"): "Games",
-            t("windows_freeware"): "Windows Freeware",
-            t("game_utilities"): "Game Utilities",
-            t("system_utilities"): "System Utilities",
-            t("developer_tools"): "Developer Tools",
-            t("docker_menu"): "Docker Menu",
-        }
-
         # Scrollable cards sized to fit the screen height
         total = len(self.items)
         row_pitch = S(70)
@@ -2188,7 +4507,7 @@ class MenuScreen(BaseScreen):
 
             # Show category stats if available
             # Map translated name back to English for stats lookup
-            english_name = category_map.get(name, name)
+            english_name = category_for_label(name)
             if self.stats and english_name in self.stats['category_stats']:
                 installed, total = self.stats['category_stats'][english_name]
                 stat_text = f"[{installed}/{total}]"
@@ -2576,9 +4895,9 @@ class InteractiveDialog(BaseScreen):
 
         # Hints
         if self.dialog_type == "checklist":
-            hint = f"X={t('hint_toggle') or 'Toggle'} | A={t('hint_confirm') or 'Confirm'} | B={t('hint_cancel') or 'Cancel'}"
+            hint = hint_line(("X", "hint_toggle"), ("A", "hint_confirm"), ("B", "hint_cancel"))
         else:
-            hint = f"A={t('hint_select') or 'Select'} | B={t('hint_cancel') or 'Cancel'}"
+            hint = hint_line(("A", "hint_select"), ("B", "hint_cancel"))
         draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (dialog_x + S(30), msg_rect.bottom + S(15)))
 
         # Options list area
@@ -2729,7 +5048,7 @@ class MenuSelectionDialog(BaseScreen):
         draw_text(screen, self.title, FONT_BIG, FG, (dialog_x + S(30), dialog_y + S(30)))
 
         # Hints
-        hint = f"A={t('hint_select')} | B={t('hint_return')}"
+        hint = hint_line(("A", "hint_select"), ("B", "hint_return"))
         draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (dialog_x + S(30), dialog_y + S(70)))
 
         # Options list area
@@ -2869,11 +5188,8 @@ class ChecklistScreen(BaseScreen):
         if not q:
             self.items = list(self.all_items)
         else:
-            def matches(k: str) -> bool:
-                if q in k.lower():
-                    return True
-                return q in DESCRIPTIONS.get(k, "").lower()
-            self.items = [k for k in self.all_items if matches(k)]
+            hits = set(SEARCH_INDEX.search(q, categories=False))
+            self.items = [k for k in self.all_items if k in hits]
         self.idx = 0
 
     def install_selected(self):
@@ -2967,11 +5283,11 @@ class ChecklistScreen(BaseScreen):
         # Normal view (search disabled at category level)
         any_selected = any(SELECTED_APPS.get(k, False) for k in self.items) if self.items else False
         all_selected = all(SELECTED_APPS.get(k, False) for k in self.items) if self.items else False
-        y_label = t("hint_remove_all") if all_selected else t("hint_add_all")
-        start_label = t("hint_start") if any_selected else t("queue")
+        y_key = "hint_remove_all" if all_selected else "hint_add_all"
+        start_key = "hint_start" if any_selected else "queue"
         queue_text = (
-            f"{t('queue')}: {len(INSTALL_QUEUE)} | {t('installed')}: {installed_count}/{len(self.all_items)} "
-            f"| A={t('hint_toggle')} | Y={y_label} | Start={start_label} | B={t('hint_return')} | Back={t('hint_back_settings')}"
+            f"{t('queue')}: {len(INSTALL_QUEUE)} | {t('installed')}: {installed_count}/{len(self.all_items)} | "
+            + hint_line(("A", "hint_toggle"), ("Y", y_key), ("Start", start_key), ("B", "hint_return"), ("Back", "hint_back_settings"))
         )
         draw_hints_line(screen, queue_text, FONT_SMALL, ACCENT, (S(40), S(70)))
         base_y = S(110)
@@ -3031,7 +5347,7 @@ class GlobalSearchScreen(BaseScreen):
     def __init__(self, query: str, app_keys: List[str]):
         global SELECTED_APPS
         self.query = query
-        self.all_items = app_keys  # flat list of matching keys
+        self.all_items = app_keys  # flat list of matching keys, best match first
         self.items = app_keys
         self.idx = 0
         # Use global SELECTED_APPS, initialize new keys if needed
@@ -3042,16 +5358,9 @@ class GlobalSearchScreen(BaseScreen):
         self.queue_message_time = 0
         self.last_action_time = 0
         self.action_cooldown = 0.2
-        # Build grouped flat list with non-selectable headers
-        self.key_to_cat = {}
-        for cat, keys in CATEGORIES.items():
-            for k in keys:
-                if k in self.all_items and k not in self.key_to_cat:
-                    self.key_to_cat[k] = cat
-        # Any keys not in CATEGORIES fall into 'Other'
-        for k in self.all_items:
-            if k not in self.key_to_cat:
-                self.key_to_cat[k] = 'Other'
+        # Build grouped flat list with non-selectable headers; keys not in
+        # CATEGORIES fall into 'Other'
+        self.key_to_cat = {k: APP_CATEGORIES.get(k, ['Other'])[0] for k in self.all_items}
         self.collapsed = set()  # categories currently collapsed
         self.flat = self._build_flat_grouped(self.all_items)
 
@@ -3059,10 +5368,9 @@ class GlobalSearchScreen(BaseScreen):
         grouped: Dict[str, List[str]] = {}
         for k in app_keys:
             grouped.setdefault(self.key_to_cat.get(k, 'Other'), []).append(k)
-        # Sort categories by name and items alphabetically
+        # Categories and items keep the ranking order: best match first
         flat = []
-        for cat in sorted(grouped.keys()):
-            keys = sorted(grouped[cat])
+        for cat, keys in grouped.items():
             flat.append(("header", cat, len(keys)))
             if cat not in self.collapsed:
                 for k in keys:
@@ -3171,10 +5479,11 @@ class GlobalSearchScreen(BaseScreen):
         draw_text(screen, title, FONT_BIG, FG, (40, 30))
 
         any_selected = any(SELECTED_APPS.values())
-        start_label = t("hint_start") if any_selected else t("queue")
+        start_key = "hint_start" if any_selected else "queue"
         count_text = (
             f"{t('found')} {len(self.all_items)} add-ons | {t('queue')}: {len(INSTALL_QUEUE)} | "
-            f"A={t('hint_toggle')}, Start={start_label}, X={t('hint_collapse_expand')}, B={t('hint_return')} | Back={t('hint_back_settings')}"
+            + hint_line(("A", "hint_toggle"), ("Start", start_key), ("X", "hint_collapse_expand"), ("B", "hint_return"), sep=", ")
+            + " | " + hint_line(("Back", "hint_back_settings"))
         )
         draw_hints_line(screen, count_text, FONT_SMALL, ACCENT, (40, 70))
 
@@ -3187,7 +5496,7 @@ class GlobalSearchScreen(BaseScreen):
         if not self.all_items:
             draw_text(screen, t("no_search_match"), FONT, MUTED, (40, base_y + 20))
             # Icon hint for returning (avoid repetition)
-            draw_hints_line(screen, f"B={t('hint_return')}", FONT_SMALL, ACCENT, (40, base_y + 55))
+            draw_hints_line(screen, hint_line(("B", "hint_return")), FONT_SMALL, ACCENT, (40, base_y + 55))
             return
 
         item_pitch = S(58)
@@ -3258,7 +5567,7 @@ class NoResultsScreen(BaseScreen):
         draw_text(screen, t("search_results"), FONT_BIG, FG, (40, 30))
         draw_text(screen, f"{t('no_addons_found')} '{self.query}'.", FONT, MUTED, (40, 90))
         # Use concise icon-based hint
-        draw_hints_line(screen, f"B={t('hint_return')} | Back={t('hint_back_settings')}", FONT_SMALL, ACCENT, (40, 130))
+        draw_hints_line(screen, hint_line(("B", "hint_return"), ("Back", "hint_back_settings")), FONT_SMALL, ACCENT, (40, 130))
 
 class QueueScreen(BaseScreen):
     def __init__(self):
@@ -3349,14 +5658,15 @@ class QueueScreen(BaseScreen):
         if not INSTALL_QUEUE:
             draw_text(screen, t("queue_empty"), FONT, MUTED, (40, 100))
             # Icon hint for returning
-            draw_hints_line(screen, f"B={t('hint_return')} | Back={t('hint_back_settings')}", FONT_SMALL, ACCENT, (40, 140))
+            draw_hints_line(screen, hint_line(("B", "hint_return"), ("Back", "hint_back_settings")), FONT_SMALL, ACCENT, (40, 140))
             draw_text(screen, t("queue_add_items"), FONT_SMALL, ACCENT, (40, 170))
         else:
             on_start_row = (self.idx == len(INSTALL_QUEUE)) and bool(INSTALL_QUEUE)
-            a_label = t("hint_start") if on_start_row else t("hint_remove")
+            a_key = "hint_start" if on_start_row else "hint_remove"
             hint = (
-                f"{t('queue_items').replace('X', str(len(INSTALL_QUEUE)))} | A={a_label} | "
-                f"LB={t('hint_move_up')} | RB={t('hint_move_down')} | Y={t('hint_clear')} | Start={t('hint_begin')} | B={t('hint_return')} | Back={t('hint_back_settings')}"
+                f"{t('queue_items').replace('X', str(len(INSTALL_QUEUE)))} | "
+                + hint_line(("A", a_key), ("LB", "hint_move_up"), ("RB", "hint_move_down"), ("Y", "hint_clear"),
+                            ("Start", "hint_begin"), ("B", "hint_return"), ("Back", "hint_back_settings"))
             )
             draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (40, 70))
 
@@ -3413,11 +5723,15 @@ class RunListScreen(BaseScreen):
         self.job_results = []  # Track success/failure of each job
         self.show_log = False  # Toggle to show error log
         self.pulse_offset = 0  # For animated progress bar pulse
+        self.waiting = False  # BUA is reinstalling itself; the next job waits
 
     def start_next(self):
         if self.current >= len(self.jobs):
             self.all_finished = True
             return
+        self.waiting = INSTALL_LOCK.locked()
+        if self.waiting:
+            return
         name, cmd = self.jobs[self.current]
         # Create a fresh runner for each job
         self.runner = Runner()
@@ -3587,8 +5901,8 @@ export -f desktop
         else:
             cmd = f"{dialog_wrap}{es_wrap}{overlay_wrap}{interactive_wrap}{system_wrap}{debug_start}{cmd}{debug_end}"
 
-        self.runner.run(cmd)
-        self.started = True
+        self.started = self.runner.run(cmd)
+        self.waiting = not self.started
 
     def handle(self, events):
         for e in events:
@@ -3693,14 +6007,16 @@ export -f desktop
                 job_name = self.jobs[self.current][0]
                 # Check if this is an uninstall job
                 if "(Uninstall)" in job_name:
+                    # Extract app name (remove " (Uninstall)" suffix)
+                    app_name = job_name.replace(" (Uninstall)", "")
                     # Remove from history if uninstall succeeded
                     if success:
-                        # Extract app name (remove " (Uninstall)" suffix)
-                        app_name = job_name.replace(" (Uninstall)", "")
                         mark_uninstalled(app_name)
+                    record_install_perf(app_name, "uninstall", self.runner)
                 else:
                     # Regular install - mark as installed
                     mark_installed(job_name, success)
+                    record_install_perf(job_name, "install", self.runner)
                 # If the installer emitted a dialog message, show it as an in-app message box
                 if self.runner.last_dialog_title or self.runner.last_dialog_text:
                     title = self.runner.last_dialog_title or job_name
@@ -3718,14 +6034,7 @@ export -f desktop
                     # If we found URLs, show them in a dialog
                     if url_lines:
                         push_screen(InfoDialog(title=job_name, message=url_lines))
-                # Refresh top-level menu stats after every install
-                try:
-                    for _s in SCREENS:
-                        if isinstance(_s, MenuScreen):
-                            _s.stats = _s.calculate_stats()
-                except Exception:
-                    pass
-                
+
                 self.current += 1
                 self.started = False
                 if self.current < len(self.jobs):
@@ -3740,7 +6049,7 @@ export -f desktop
         if self.show_log:
             draw_text(screen, t("installation_log"), FONT_BIG, FG, (40, 30))
             # Icon hints: X hides log, B returns
-            draw_hints_line(screen, f"X={t('hint_hide_log')} | B={t('hint_return')} | Back={t('hint_back_settings')}", FONT_SMALL, ACCENT, (40, 70))
+            draw_hints_line(screen, hint_line(("X", "hint_hide_log"), ("B", "hint_return"), ("Back", "hint_back_settings")), FONT_SMALL, ACCENT, (40, 70))
             log_rect = pygame.Rect(40, 90, W-80, H-140)
             pygame.draw.rect(screen, CARD, log_rect, border_radius=12)
             
@@ -3755,7 +6064,7 @@ export -f desktop
             return
         
         draw_text(screen, self.title, FONT_BIG, FG, (40, 30))
-        draw_hints_line(screen, f"B={t('hint_return')} | X={t('hint_view_log')} | Back={t('hint_back_settings')}", FONT_SMALL, ACCENT, (40, 70))
+        draw_hints_line(screen, hint_line(("B", "hint_return"), ("X", "hint_view_log"), ("Back", "hint_back_settings")), FONT_SMALL, ACCENT, (40, 70))
         
         # Progress info with spinner
         progress_y = 100
@@ -3769,6 +6078,8 @@ export -f desktop
             status_text = f"{spinner} {t('installing')} {completed + 1} of {total_jobs}: {self.jobs[self.current][0]}"
         elif self.all_finished:
             status_text = t("all_complete")
+        elif self.waiting:
+            status_text = t("bua_updating_wait")
         else:
             status_text = t("preparing")
 
@@ -3871,6 +6182,7 @@ def parse_github_raw_url(cmd: str):
     Supports both github.com/.../raw/... and raw.githubusercontent.com forms.
     Returns None if cannot parse.
     """
+    from urllib.parse import urlparse
     try:
         # Find first URL-looking token
         parts = cmd.split()
@@ -3925,24 +6237,24 @@ def get_script_dates() -> Dict[str, str]:
     _SCRIPT_DATES_CACHE = {}
     try:
         script_dates_url = "https://raw.githubusercontent.com/batocera-unofficial-addons/batocera-unofficial-addons/main/SCRIPT_DATES.md"
-        req = urllib.request.Request(script_dates_url, headers={"User-Agent": "BUA-Updater"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            content = resp.read().decode("utf-8", "ignore")
-            # Parse markdown table format: | `path/to/file.sh` | YYYY-MM-DD |
-            for line in content.splitlines():
-                line = line.strip()
-                if not line.startswith("|") or line.count("|") < 3:
-                    continue
-                parts = [p.strip() for p in line.split("|")]
-                if len(parts) >= 3:
-                    # parts[0] is empty (before first |)
-                    # parts[1] is the path wrapped in backticks
-                    # parts[2] is the date
-                    file_path = parts[1].strip("`").strip()
-                    date_str = parts[2].strip()
-                    # Skip header rows and separator rows
-                    if file_path and date_str and date_str != "N/A" and not file_path.startswith("-") and file_path != "File":
-                        _SCRIPT_DATES_CACHE[file_path] = date_str
+        # Revalidated against the stored copy, which is also used offline
+        body = fetch_cached_remote(script_dates_url, timeout=10)
+        content = body.decode("utf-8", "ignore") if body else ""
+        # Parse markdown table format: | `path/to/file.sh` | YYYY-MM-DD |
+        for line in content.splitlines():
+            line = line.strip()
+            if not line.startswith("|") or line.count("|") < 3:
+                continue
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) >= 3:
+                # parts[0] is empty (before first |)
+                # parts[1] is the path wrapped in backticks
+                # parts[2] is the date
+                file_path = parts[1].strip("`").strip()
+                date_str = parts[2].strip()
+                # Skip header rows and separator rows
+                if file_path and date_str and date_str != "N/A" and not file_path.startswith("-") and file_path != "File":
+                    _SCRIPT_DATES_CACHE[file_path] = date_str
     except Exception:
         pass
 
@@ -3972,8 +6284,48 @@ def github_latest_commit_date(owner: str, repo: str, branch: str, path: str) ->
 
 # Global GitHub cache that persists across UpdaterScreen instances
 # This prevents "unknown API error" when re-entering the updater
+# status is a translation key, translated when drawn
 GITHUB_CACHE: Dict[str, tuple] = {}  # {app: (status, needs_update, detail)}
 
+def load_update_checks() -> Dict[str, tuple]:
+    """Results stored by earlier checks, in GITHUB_CACHE form. Rows are dropped
+    whenever the app's install history changes, so what remains is current."""
+    if not STATE.available():
+        return {}
+    STATE_WRITER.flush()  # apply invalidations from queued history changes first
+    rows = STATE.query("SELECT app, status, needs_update, detail FROM update_checks")
+    return {app: (status, bool(needs), detail) for app, status, needs, detail in rows}
+
+# Installed apps (a successful install event) whose stored check found an update
+INSTALLED_WITH_UPDATES_SQL = """
+SELECT DISTINCT c.app, c.detail FROM update_checks AS c
+JOIN install_events AS e ON e.app = c.app AND e.success = 1
+WHERE c.needs_update = 1
+ORDER BY c.app COLLATE NOCASE
+"""
+
+def installed_apps_with_updates() -> List[Tuple[str, str]]:
+    """(app, remote date) of installed apps with an update, per the stored checks."""
+    if not STATE.available():
+        return []
+    STATE_WRITER.flush()
+    return [(app, detail) for app, detail in STATE.query(INSTALLED_WITH_UPDATES_SQL)]
+
+def save_update_checks(checks: List[tuple]):
+    """Store (app, remote_ts, status, needs_update, detail) results in one transaction."""
+    if not checks or not STATE.available():
+        return
+    now = time.time()
+    try:
+        with STATE.transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO update_checks (app, checked, remote_ts, status, needs_update, detail) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(app, now, remote_ts, status, int(needs), detail) for app, remote_ts, status, needs, detail in checks],
+            )
+    except Exception as e:
+        print(f"[BUA] Failed to store update checks: {e}")
+
 
 class UpdaterScreen(BaseScreen):
     def __init__(self):
@@ -3993,17 +6345,18 @@ class UpdaterScreen(BaseScreen):
 
     def _scan(self, use_cache=False):
         try:
-            # Get apps from JSON history
-            json_installed = [k for k in APPS.keys() if is_installed(k)]
-
-            # Scan directory for apps not in JSON (returns dict: app_name -> mtime)
-            dir_installed_dict = scan_installed_addons_directory()
-
-            # Combine both lists, removing duplicates
-            installed_apps = list(set(json_installed + list(dir_installed_dict.keys())))
-            installed_apps.sort()
+            if not GITHUB_CACHE:
+                GITHUB_CACHE.update(load_update_checks())
+            if not network_available():
+                # Offline: show what the last online check found
+                use_cache = True
+            # Apps from the install history plus apps found on disk without one
+            # (dir_installed_dict: app_name -> mtime)
+            dir_installed_dict = INSTALLED_INDEX.present()
+            installed_apps = INSTALLED_INDEX.installed_apps()
 
             results = []
+            checks = []
             for app in installed_apps:
                 # If using cache and we have cached data for this app, reuse it
                 if use_cache and app in GITHUB_CACHE:
@@ -4023,22 +6376,23 @@ class UpdaterScreen(BaseScreen):
                         last_ts = datetime.strptime(last_date_str, "%Y-%m-%d %H:%M:%S").timestamp()
                     except Exception:
                         last_ts = 0.0
+                remote_ts = None
                 if parsed:
                     owner, repo, branch, path = parsed
                     remote_ts = github_latest_commit_date(owner, repo, branch, path)
                     if remote_ts is None:
-                        status = t("unknown_api_error")
+                        status = "unknown_api_error"
                         needs = False
                         detail = f"{owner}/{repo}:{branch}/{path}"
                     else:
                         if remote_ts > last_ts + 1:  # small skew tolerance
-                            status = t("update_available")
+                            status = "update_available"
                             needs = True
                             detail = time.strftime("%Y-%m-%d %H:%M", time.gmtime(remote_ts))
                         else:
                             # Show special status for directory-only apps with their directory timestamp
                             if is_from_directory_only:
-                                status = "Installed (no history)"
+                                status = "installed_no_history"
                                 # Use directory modification time if available
                                 dir_mtime = dir_installed_dict.get(app)
                                 if dir_mtime:
@@ -4046,17 +6400,20 @@ class UpdaterScreen(BaseScreen):
                                 else:
                                     detail = ""
                             else:
-                                status = t("up_to_date")
+                                status = "up_to_date"
                                 detail = time.strftime("%Y-%m-%d %H:%M", time.gmtime(remote_ts))
                             needs = False
                 else:
-                    status = t("unknown_source")
+                    status = "unknown_source"
                     needs = False
                     detail = ""
 
                 # Cache the result globally
                 GITHUB_CACHE[app] = (status, needs, detail)
+                if remote_ts is not None:
+                    checks.append((app, remote_ts, status, needs, detail))
                 results.append((app, status, needs, detail))
+            save_update_checks(checks)
 
             # Sort: updates first, then by name
             results.sort(key=lambda x: (not x[2], x[0].lower()))
@@ -4107,6 +6464,8 @@ class UpdaterScreen(BaseScreen):
                 if e.key == pygame.K_SPACE:  # Start on keyboard
                     if not self.loading:
                         self.queue_updates()
+                if e.key == pygame.K_x:
+                    self.show_install_stats()
             if e.type == pygame.JOYHATMOTION:
                 _x, y = e.value
                 if y == -1:
@@ -4129,6 +6488,19 @@ class UpdaterScreen(BaseScreen):
                 if e.button in (BTN_Y,):  # Y -> uninstall current app
                     if not self.loading and self.items:
                         self.uninstall_app()
+                if e.button in (BTN_X,):  # X -> install stats of current app
+                    self.show_install_stats()
+
+    def show_install_stats(self):
+        """Show the recorded installs of the selected app and export the full report."""
+        if self.loading or not self.items:
+            return
+        app = self.items[self.idx][0]
+        lines = [format_install_perf(r) for r in install_perf_records(app, limit=8)] or [t("no_install_stats")]
+        report = export_install_report()
+        if report:
+            lines += ["", f"{t('install_report_saved')}: {report}"]
+        push_screen(InfoDialog(app, lines))
 
     def uninstall_app(self):
         """Uninstall the currently selected app inline"""
@@ -4146,9 +6518,12 @@ class UpdaterScreen(BaseScreen):
             return
 
         # Start inline uninstall
+        runner = Runner()
+        if not runner.run(uninstall_cmd):
+            push_screen(InfoDialog(t("uninstall"), [t("bua_updating_wait")]))
+            return
         self.uninstalling_app = app
-        self.runner = Runner()
-        self.runner.run(uninstall_cmd)
+        self.runner = runner
 
     def queue_updates(self):
         if self.loading:
@@ -4179,6 +6554,7 @@ class UpdaterScreen(BaseScreen):
             if success:
                 # Remove from history
                 mark_uninstalled(self.uninstalling_app)
+            record_install_perf(self.uninstalling_app, "uninstall", self.runner)
             self.uninstalling_app = None
             self.runner = None
             # Trigger rescan to refresh list
@@ -4195,12 +6571,13 @@ class UpdaterScreen(BaseScreen):
                 current_needs = False
         hint_parts = []
         if current_needs:
-            hint_parts.append(f"A={t('hint_toggle')}")
-        hint_parts.append(f"Y={t('hint_uninstall')}")
-        hint_parts.append(f"Start={t('hint_queue')}")
-        hint_parts.append(f"B={t('hint_return')}")
-        hint_parts.append(f"Back={t('hint_back_settings')}")
-        draw_hints_line(screen, " | ".join(hint_parts), FONT_SMALL, ACCENT, (40, 70))
+            hint_parts.append(("A", "hint_toggle"))
+        hint_parts.append(("Y", "hint_uninstall"))
+        hint_parts.append(("X", "hint_install_stats"))
+        hint_parts.append(("Start", "hint_queue"))
+        hint_parts.append(("B", "hint_return"))
+        hint_parts.append(("Back", "hint_back_settings"))
+        draw_hints_line(screen, hint_line(*hint_parts), FONT_SMALL, ACCENT, (40, 70))
 
         if self.loading:
             draw_text(screen, t("scanning_updates"), FONT, MUTED, (40, 100))
@@ -4247,7 +6624,7 @@ class UpdaterScreen(BaseScreen):
             else:
                 color = ACCENT if needs else MUTED
                 suffix = f" — {detail}" if detail else ""
-                draw_text(screen, status + suffix, FONT_SMALL, color, (name_x, rect.y + 30))
+                draw_text(screen, t(status) + suffix, FONT_SMALL, color, (name_x, rect.y + 30))
 
 
 class OnScreenKeyboard:
@@ -4409,14 +6786,17 @@ SCREENS: List[BaseScreen] = []
 INSTALL_QUEUE: List[Tuple[str, str]] = []  # Global queue for installs
 SELECTED_APPS: Dict[str, bool] = {}  # Global selections that persist across category navigation
 
+def settings_menu_items() -> List[Tuple[str, str]]:
+    return [
+        (t("controller_layout"), t("controller_layout_desc")),
+        (t("configure_buttons"), t("configure_buttons_desc")),
+        (t("language"), t("language_desc")),
+        (t("cards_per_page"), t("cards_per_page_desc")),
+    ]
+
 class SettingsScreen(BaseScreen):
     def __init__(self):
-        self.items = [
-            (t("controller_layout"), t("controller_layout_desc")),
-            (t("configure_buttons"), t("configure_buttons_desc")),
-            (t("language"), t("language_desc")),
-            (t("cards_per_page"), t("cards_per_page_desc")),
-        ]
+        self.items = settings_menu_items()
         self.idx = 0
 
     def handle(self, events):
@@ -4467,7 +6847,7 @@ class SettingsScreen(BaseScreen):
     def draw(self):
         draw_background(screen)
         draw_text(screen, t("settings_title"), FONT_BIG, FG, (40, 30))
-        hint = f"A={t('hint_open')} | B={t('hint_return')} | Back={t('hint_close_settings')}"
+        hint = hint_line(("A", "hint_open"), ("B", "hint_return"), ("Back", "hint_close_settings"))
         draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (40, 70))
         base_y = 110
         y = base_y
@@ -4548,7 +6928,7 @@ class ControllerLayoutScreen(BaseScreen):
         draw_background(screen)
         title = t("controller_layout_title")
         draw_text(screen, title, FONT_BIG, FG, (40, 30))
-        hint = f"A={t('hint_select')} | B={t('hint_return')} | Back={t('hint_back_settings')}"
+        hint = hint_line(("A", "hint_select"), ("B", "hint_return"), ("Back", "hint_back_settings"))
         draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (40, 70))
 
         base_y = 110
@@ -4565,14 +6945,51 @@ class ControllerLayoutScreen(BaseScreen):
             draw_text(screen, label, FONT, FG, (rect.x + 14, rect.y + 8))
 
 
+def refresh_translated_screens():
+    """Re-label screens on the stack after the translation table changed."""
+    global TOP_LEVEL
+    # Refresh TOP_LEVEL menu with new translations
+    TOP_LEVEL = get_top_level()
+    try:
+        pygame.display.set_caption(t('main_title'))
+    except Exception:
+        pass
+
+    # Update all screens in the stack with new translations
+    for screen in SCREENS:
+        if isinstance(screen, MenuScreen):
+            screen.title = t("main_title")
+            screen.items = TOP_LEVEL
+        elif isinstance(screen, SettingsScreen):
+            # Refresh settings items with new translations
+            screen.items = settings_menu_items()
+
 class LanguageScreen(BaseScreen):
+    PREFETCH_DWELL = 0.3  # seconds a language must stay highlighted before it is prefetched
+
     def __init__(self):
         self.options = get_available_languages()  # List of (name, code, native_name) tuples
         # Find current language index
         self.idx = next((i for i, (_n, code, _native) in enumerate(self.options) if code == CURRENT_LANGUAGE), 0)
         self.scroll_offset = 0
+        # Language being downloaded after A was pressed: (code, native), and its result
+        self.switching: Tuple[str, str] | None = None
+        self.switch_result: Tuple[str, Dict[str, str]] | None = None
+        self.highlight_idx = self.idx
+        self.highlight_since = time.monotonic()
+        self.prefetched: set = set()
 
     def handle(self, events):
+        if self.switching:
+            # Keep rendering while the table downloads; B/Esc cancels the switch
+            for e in events:
+                if e.type == pygame.QUIT:
+                    clean_exit(0)
+                if (e.type == pygame.KEYDOWN and e.key == pygame.K_ESCAPE) or \
+                   (e.type == pygame.JOYBUTTONDOWN and e.button in (BTN_B, BTN_BACK)):
+                    self.switching = None
+            return
+
         # Process analog stick for navigation (arcade cabinet support)
         analog_v, _analog_h = process_analog_navigation(events)
         if analog_v == 1:  # Down
@@ -4625,32 +7042,47 @@ class LanguageScreen(BaseScreen):
         max_scroll = max(0, len(self.options) - visible_items)
         self.scroll_offset = max(0, min(self.scroll_offset, max_scroll))
 
+    def update(self):
+        if self.switching and self.switch_result and self.switch_result[0] == self.switching[0]:
+            code, table = self.switch_result
+            native = self.switching[1]
+            self.switching = self.switch_result = None
+            self.finish_switch(code, native, table)
+            return
+
+        # Speculatively fetch the highlighted language so A is usually instant
+        if self.idx != self.highlight_idx:
+            self.highlight_idx = self.idx
+            self.highlight_since = time.monotonic()
+        elif time.monotonic() - self.highlight_since >= self.PREFETCH_DWELL:
+            code = self.options[self.idx][1]
+            if code not in self.prefetched:
+                self.prefetched.add(code)
+                prefetch_translation(code)
+
     def apply_choice(self):
-        global CURRENT_LANGUAGE, TRANSLATIONS, TOP_LEVEL
         _name, code, native = self.options[self.idx]
 
-        # Save and load the new language
-        save_language(code)
-
-        # Refresh TOP_LEVEL menu with new translations
-        TOP_LEVEL = get_top_level()
-
-        # Update all screens in the stack with new translations
-        for screen in SCREENS:
-            if isinstance(screen, MenuScreen):
-                screen.title = t("main_title")
-                screen.items = TOP_LEVEL
-                # Recalculate stats to update translated strings
-                if screen.stats:
-                    screen.stats = screen.calculate_stats()
-            elif isinstance(screen, SettingsScreen):
-                # Refresh settings items with new translations
-                screen.items = [
-                    (t("controller_layout"), t("controller_layout_desc")),
-                    (t("configure_buttons"), t("configure_buttons_desc")),
-                    (t("language"), t("language_desc")),
-                    (t("resolution"), t("resolution_desc")),
-                ]
+        table = TRANSLATIONS.get(code)
+        if table is None:
+            table = load_cached_translation(code)
+        if table is not None:
+            self.finish_switch(code, native, table)
+            return
+
+        # Not downloaded yet: fetch in the background and apply when it arrives
+        self.switching = (code, native)
+        self.switch_result = None
+
+        def fetch():
+            self.switch_result = (code, load_translation_file(code))
+
+        threading.Thread(target=fetch, name=f"bua-language-{code}", daemon=True).start()
+
+    def finish_switch(self, code: str, native: str, table: Dict[str, str]):
+        # Save the preference and swap the table in one step
+        save_language(code, table)
+        refresh_translated_screens()
 
         msg = [f"{t('language')}: {native}"]
         push_screen(InfoDialog(t("settings_title"), msg))
@@ -4658,7 +7090,7 @@ class LanguageScreen(BaseScreen):
     def draw(self):
         draw_background(screen)
         draw_text(screen, t("language"), FONT_BIG, FG, (40, 30))
-        hint = f"A={t('hint_select')} | B={t('hint_return')} | Back={t('hint_back_settings')}"
+        hint = hint_line(("A", "hint_select"), ("B", "hint_return"), ("Back", "hint_back_settings"))
         draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (40, 70))
 
         base_y = 110
@@ -4667,7 +7099,13 @@ class LanguageScreen(BaseScreen):
 
         # Get current language's native name for display
         current_native = next((native for _name, code, native in self.options if code == CURRENT_LANGUAGE), CURRENT_LANGUAGE.upper())
-        draw_text(screen, f"{t('current')}: {current_native}", FONT_SMALL, MUTED, (card_x, base_y))
+        current_text = f"{t('current')}: {current_native}"
+        draw_text(screen, current_text, FONT_SMALL, MUTED, (card_x, base_y))
+        if self.switching:
+            # Download in progress for the chosen language
+            dots = "." * (int(time.monotonic() * 3) % 4)
+            progress_x = card_x + FONT_SMALL.size(current_text)[0] + S(24)
+            draw_text(screen, f"→ {self.switching[1]}{dots}", FONT_SMALL, ACCENT, (progress_x, base_y))
         base_y += 36
 
         # Calculate visible area
@@ -4759,7 +7197,7 @@ class CardsPerPageScreen(BaseScreen):
     def draw(self):
         draw_background(screen)
         draw_text(screen, t("cards_per_page"), FONT_BIG, FG, (40, 30))
-        hint = f"A={t('hint_select')} | B={t('hint_return')} | Back={t('hint_close_settings')}"
+        hint = hint_line(("A", "hint_select"), ("B", "hint_return"), ("Back", "hint_close_settings"))
         draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (40, 70))
 
         base_y = 110
@@ -4897,7 +7335,7 @@ class ResolutionScreen(BaseScreen):
     def draw(self):
         draw_background(screen)
         draw_text(screen, t("resolution"), FONT_BIG, FG, (40, 30))
-        hint = f"A={t('hint_select')} | B={t('hint_return')} | Back={t('hint_close_settings')}"
+        hint = hint_line(("A", "hint_select"), ("B", "hint_return"), ("Back", "hint_close_settings"))
         draw_hints_line(screen, hint, FONT_SMALL, ACCENT, (40, 70))
 
         base_y = 110
@@ -4963,6 +7401,69 @@ def pop_screen():
         SCREENS.pop()
 
 
+# ------------------------------
+# Boot sequence
+# ------------------------------
+# Everything with side effects runs here rather than at import time, so the
+# first frame can be shown as early as possible. The time to first frame and
+# to the main menu is checked against BUA_STARTUP_BUDGET_MS; an overrun is
+# logged, marked in the trace and kept in STARTUP_OVER_BUDGET. Startup phases
+# not marked critical only start once the main menu is ready.
+
+STARTUP_BUDGET_MS = _env_int("BUA_STARTUP_BUDGET_MS", 1500)
+STARTUP_OVER_BUDGET = False
+
+def check_startup_budget(milestone: str) -> float:
+    """Log the time since process start against STARTUP_BUDGET_MS"""
+    global STARTUP_OVER_BUDGET
+    elapsed_ms = (time.perf_counter() - _PROCESS_STARTED) * 1000
+    if elapsed_ms > STARTUP_BUDGET_MS:
+        STARTUP_OVER_BUDGET = True
+        trace_instant(f"{milestone}_over_budget")
+        print(f"[BUA] WARNING: {milestone} after {elapsed_ms:.0f} ms, over the {STARTUP_BUDGET_MS} ms budget")
+    else:
+        print(f"[BUA] {milestone.capitalize()} after {elapsed_ms:.0f} ms (budget {STARTUP_BUDGET_MS} ms)")
+    return elapsed_ms
+
+def report_import_profile(limit: int = 20):
+    """Print the slowest imports recorded with BUA_IMPORT_PROFILE=1"""
+    if not _IMPORT_TIMES:
+        return
+    total = sum(_IMPORT_TIMES.values())
+    print(f"[BUA] Import profile ({len(_IMPORT_TIMES)} modules):")
+    for name, secs in sorted(_IMPORT_TIMES.items(), key=lambda kv: kv[1], reverse=True)[:limit]:
+        print(f"[BUA]   {secs * 1000:8.1f} ms  {name}")
+    print(f"[BUA]   {total * 1000:8.1f} ms  (sum, nested imports counted in their parent too)")
+
+def boot():
+    """Initialise pygame, show the first frame, then load fonts and controllers."""
+    global clock, FONT, FONT_SMALL, FONT_BIG, PAD_STYLE
+    # Probe connectivity while pygame starts; startup fetches share one budget
+    start_network_probe()
+    begin_startup_network_budget()
+    index_catalog()
+    load_startup_snapshot()
+    with trace_span("pygame.init"):
+        pygame.init()
+    pygame.mouse.set_visible(False)
+    with trace_span("init_display"):
+        init_display()
+    clock = pygame.time.Clock()
+
+    # First frame: plain background while everything else loads
+    screen.fill(BG)
+    pygame.display.flip()
+    trace_instant("first_frame")
+    check_startup_budget("first frame")
+    report_import_profile()
+
+    SETTINGS.load()
+    FONT, FONT_SMALL, FONT_BIG = load_fonts()
+    init_joysticks()
+    with trace_span("button_mapping"):
+        PAD_STYLE = detect_pad_style()
+        update_button_mapping()
+
 def main():
     push_screen(MenuScreen(t("main_title"), TOP_LEVEL))
 
@@ -4980,6 +7481,11 @@ def main():
         push_screen(ChangelogDialog())
 
     while True:
+        # Surface messages from background startup phases
+        for title, lines in take_startup_notices():
+            push_screen(InfoDialog(title, lines))
+        # Hot-swap translations refreshed in the background
+        apply_pending_translations()
         events = pygame.event.get()
         # Handle window resize for windowed mode
         # React to device add/remove and resizing
@@ -5057,6 +7563,194 @@ def main():
         clock.tick(60)
 
 
+# ------------------------------
+# Splash video
+# ------------------------------
+# The splash is transcoded once into raw RGB frames at display resolution and
+# memory-mapped on later launches, so playback wraps mmap slices as surfaces
+# without decoding, scaling or copying. When the frames would not fit
+# SPLASH_FRAMES_MAX_BYTES, every n-th frame is kept and played at fps / n.
+SPLASH_FRAMES_FILE = "/userdata/system/add-ons/bua_splash_frames.rgb"
+SPLASH_FRAMES_META = "/userdata/system/add-ons/bua_splash_frames.json"
+SPLASH_FRAMES_MAX_BYTES = 256 * 1024 * 1024  # frames are dropped to fit
+SPLASH_QUEUE_SIZE = 8
+
+def _splash_source_key(video_file: str) -> str:
+    st = os.stat(video_file)
+    return f"{st.st_size}:{int(st.st_mtime)}"
+
+def _splash_frame_step(screen_size: Tuple[int, int], frame_count: int) -> int:
+    """Keep every n-th frame so the cached frames fit SPLASH_FRAMES_MAX_BYTES"""
+    w, h = screen_size
+    max_frames = max(1, SPLASH_FRAMES_MAX_BYTES // (w * h * 3))
+    return max(1, -(-frame_count // max_frames))
+
+def _open_splash_frame_cache(video_file: str, screen_size: Tuple[int, int]):
+    """Return (mmap, meta) if a frame cache matches this video and screen, else None"""
+    import mmap
+    try:
+        with open(SPLASH_FRAMES_META, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("source") != _splash_source_key(video_file) or tuple(meta.get("screen", ())) != tuple(screen_size):
+            return None
+        frame_bytes = screen_size[0] * screen_size[1] * 3
+        if meta["frames"] <= 0 or os.path.getsize(SPLASH_FRAMES_FILE) != frame_bytes * meta["frames"]:
+            return None
+        with open(SPLASH_FRAMES_FILE, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return mm, meta
+    except Exception:
+        return None
+
+@traced("splash_decode", "splash")
+def _decode_splash(video, video_file: str, screen_size: Tuple[int, int], step: int,
+                   fps: float, frames_q, stop_event: threading.Event):
+    """Producer: decode, resize and convert frames off the UI thread.
+
+    Screen-sized frames go to frames_q (bounded, so decoding is paced by
+    playback) and every step-th frame of the first full pass is written to
+    the frame cache. After stop_event is set the current pass is finished
+    for the cache, then the thread exits.
+    """
+    import cv2
+    tmp = SPLASH_FRAMES_FILE + ".tmp"
+    out = None
+    try:
+        os.makedirs(os.path.dirname(SPLASH_FRAMES_FILE), exist_ok=True)
+        out = open(tmp, "wb")
+    except Exception as e:
+        print(f"[BUA] Could not create splash frame cache: {e}")
+    index = count = 0
+    try:
+        while True:
+            ret, frame = video.read()
+            if not ret:
+                if out is not None:
+                    out.close()
+                    out = None
+                    if count:
+                        os.replace(tmp, SPLASH_FRAMES_FILE)
+                        with open(SPLASH_FRAMES_META, "w", encoding="utf-8") as f:
+                            json.dump({
+                                "source": _splash_source_key(video_file),
+                                "screen": list(screen_size),
+                                "frames": count,
+                                "fps": fps / step,
+                            }, f)
+                        print(f"[BUA] Splash frame cache written ({count} frames at {screen_size[0]}x{screen_size[1]})")
+                if stop_event.is_set():
+                    break
+                # Loop video
+                video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                continue
+
+            if (frame.shape[1], frame.shape[0]) != screen_size:
+                frame = cv2.resize(frame, screen_size, interpolation=cv2.INTER_AREA)
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            if out is not None:
+                if index % step == 0:
+                    out.write(frame.data)
+                    count += 1
+                index += 1
+            elif stop_event.is_set():
+                break
+            # The surface shares the array's memory
+            _put_splash_frame(frames_q, pygame.image.frombuffer(frame, screen_size, "RGB"), stop_event)
+    except Exception as e:
+        print(f"[BUA] Splash decoder error: {e}")
+    finally:
+        video.release()
+        if out is not None:
+            out.close()
+            try:
+                os.unlink(tmp)
+            except Exception:
+                pass
+
+def _put_splash_frame(frames_q, surface, stop_event: threading.Event):
+    while not stop_event.is_set():
+        try:
+            frames_q.put(surface, timeout=0.5)
+            return
+        except Exception:
+            continue
+
+def _show_splash_frame(surface):
+    screen.blit(surface, (0, 0))
+    pygame.display.flip()
+
+def _play_splash_frames(frames_q, fps: float, loading_complete: threading.Event):
+    """Consumer: blit frames from the decoder until loading completes"""
+    import queue
+    clock = pygame.time.Clock()
+    while not loading_complete.is_set():
+        try:
+            _show_splash_frame(frames_q.get(timeout=0.1))
+        except queue.Empty:
+            pass
+        if _splash_events_quit():
+            break
+        clock.tick(fps)
+
+def _play_cached_splash(mm, meta: dict, screen_size: Tuple[int, int], loading_complete: threading.Event):
+    """Blit frames straight out of the mapped cache until loading completes"""
+    frame_bytes = screen_size[0] * screen_size[1] * 3
+    view = memoryview(mm)
+    clock = pygame.time.Clock()
+    idx = 0
+    try:
+        while not loading_complete.is_set():
+            _show_splash_frame(pygame.image.frombuffer(view[idx * frame_bytes:(idx + 1) * frame_bytes], screen_size, "RGB"))
+            if _splash_events_quit():
+                break
+            idx = (idx + 1) % meta["frames"]
+            clock.tick(meta.get("fps") or 30)
+    finally:
+        view.release()
+
+def _splash_events_quit() -> bool:
+    # Handle events to prevent freezing
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            return True
+    return False
+
+def play_splash_video(video_file: str, loading_complete: threading.Event):
+    """Loop the splash until loading_complete is set.
+    Raises ImportError if there is no frame cache and cv2 is unavailable."""
+    import queue
+    screen_size = screen.get_size()
+
+    cache = _open_splash_frame_cache(video_file, screen_size)
+    if cache is not None:
+        mm, meta = cache
+        try:
+            _play_cached_splash(mm, meta, screen_size, loading_complete)
+        finally:
+            try:
+                mm.close()
+            except BufferError:
+                pass  # a surface still wraps it; the map is freed with it
+        return
+
+    import cv2
+
+    video = cv2.VideoCapture(video_file)
+    fps = video.get(cv2.CAP_PROP_FPS) or 30
+    frame_count = int(video.get(cv2.CAP_PROP_FRAME_COUNT) or 0)
+    frames_q = queue.Queue(maxsize=SPLASH_QUEUE_SIZE)
+    stop_event = threading.Event()
+    threading.Thread(
+        target=_decode_splash,
+        args=(video, video_file, screen_size, _splash_frame_step(screen_size, frame_count), fps, frames_q, stop_event),
+        name="bua-splash-decode",
+        daemon=True,
+    ).start()
+    try:
+        _play_splash_frames(frames_q, fps, loading_complete)
+    finally:
+        stop_event.set()
+
 def play_splash_and_load():
     """Play splash video while loading assets and translations in background."""
     import tempfile
@@ -5067,19 +7761,21 @@ def play_splash_and_load():
     def load_in_background():
         """Load translations and assets in background."""
         try:
-            # Load translations
-            load_language()
-            # Load cards per page preference
-            load_saved_cards_per_page()
-            # Load assets (images, icons)
-            init_assets()
+            with trace_span("background_load"):
+                # Switch to the published catalog, then load translations
+                load_catalog()
+                load_language()
+                # Load cards per page preference
+                load_saved_cards_per_page()
+                # Load assets (images, icons)
+                init_assets()
         except Exception as e:
             print(f"[BUA] Error loading assets: {e}")
         finally:
             loading_complete.set()
 
     print("[BUA] Loading assets in background...")
-    loader_thread = threading.Thread(target=load_in_background, daemon=True)
+    loader_thread = threading.Thread(target=load_in_background, name="bua-loader", daemon=True)
     loader_thread.start()
 
     # Download and play splash video while loading
@@ -5094,12 +7790,13 @@ def play_splash_and_load():
         else:
             # Download splash with retry logic
             print("[BUA] Downloading splash video...")
-            splash_data = fetch_url_with_retry(
-                splash_url,
-                headers={"User-Agent": "BUA-Splash"},
-                timeout=5,
-                retries=2
-            )
+            with trace_span("splash_download"):
+                splash_data = fetch_url_with_retry(
+                    splash_url,
+                    headers={"User-Agent": "BUA-Splash"},
+                    timeout=5,
+                    retries=2
+                )
 
             # Save to cache
             try:
@@ -5118,61 +7815,10 @@ def play_splash_and_load():
         if splash_file:
             print(f"[BUA] Playing splash video...")
 
-        # Play video in the pygame window using cv2
+        # Play video in the pygame window (frame cache or cv2 decoder)
         try:
-            import cv2
-
-            video = cv2.VideoCapture(splash_file)
-            fps = video.get(cv2.CAP_PROP_FPS) or 30
-            frame_delay = 1.0 / fps
-
-            global screen
-            video_running = True
-            last_frame_time = 0
-
-            while video_running and not loading_complete.is_set():
-                current_time = pygame.time.get_ticks() / 1000.0
-
-                # Only read next frame if enough time has passed
-                if current_time - last_frame_time >= frame_delay:
-                    ret, frame = video.read()
-
-                    if not ret:
-                        # Loop video
-                        video.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                        continue
-
-                    # Convert BGR to RGB
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-                    # Scale frame to screen size
-                    frame = cv2.resize(frame, (screen.get_width(), screen.get_height()))
-
-                    # Transpose for pygame
-                    frame = frame.swapaxes(0, 1)
-
-                    # Convert to pygame surface and display
-                    frame_surface = pygame.surfarray.make_surface(frame)
-
-                    # Center the frame on screen
-                    x = (screen.get_width() - frame_surface.get_width()) // 2
-                    y = (screen.get_height() - frame_surface.get_height()) // 2
-
-                    # Display frame centered
-                    screen.fill((0, 0, 0))  # Clear screen with black
-                    screen.blit(frame_surface, (x, y))
-                    pygame.display.flip()
-
-                    last_frame_time = current_time
-
-                # Handle events to prevent freezing
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        video_running = False
-
-                pygame.time.Clock().tick(60)
-
-            video.release()
+            with trace_span("splash_playback"):
+                play_splash_video(splash_file, loading_complete)
 
         except (ImportError, Exception) as e:
             print(f"[BUA] Could not play video with cv2: {e}, showing loading screen instead")
@@ -5182,7 +7828,7 @@ def play_splash_and_load():
             splash_screen.fill((20, 24, 31))
 
             # Show loading text
-            font = pygame.font.Font(None, 72)
+            font = get_font(None, 72)
             text = font.render("Loading...", True, (235, 242, 247))
             text_rect = text.get_rect(center=(splash_screen.get_width() // 2, splash_screen.get_height() // 2))
             splash_screen.blit(text, text_rect)
@@ -5204,7 +7850,7 @@ def play_splash_and_load():
         try:
             splash_screen = screen
             splash_screen.fill((20, 24, 31))
-            font = pygame.font.Font(None, 72)
+            font = get_font(None, 72)
             text = font.render("Loading...", True, (235, 242, 247))
             text_rect = text.get_rect(center=(splash_screen.get_width() // 2, splash_screen.get_height() // 2))
             splash_screen.blit(text, text_rect)
@@ -5215,7 +7861,8 @@ def play_splash_and_load():
         loading_complete.wait()
 
     # Wait for loading to complete if not already done
-    loading_complete.wait()
+    with trace_span("wait_for_loader"):
+        loading_complete.wait()
 
     # Initialize TOP_LEVEL now that translations are loaded
     global TOP_LEVEL
@@ -5224,7 +7871,14 @@ def play_splash_and_load():
     # Set window caption now that translations are loaded
     pygame.display.set_caption(t('main_title'))
 
-    print("[BUA] Ready!")
+    end_startup_network_budget()
+    check_startup_budget("ready")
+    trace_instant("ready")
+    STARTUP_READY.set()
+    if _IMPORT_TIMES:
+        report_import_profile()
+    # Flush now so the startup timeline survives even if the app is killed later
+    write_trace()
 
 def setup_custom_service_handler():
     """Check if custom_service_handler exists, download if missing, and enable it."""
@@ -5243,8 +7897,9 @@ def setup_custom_service_handler():
         os.makedirs("/userdata/system/services", exist_ok=True)
 
         # Download the service file
+        import urllib.request
         req = urllib.request.Request(SERVICE_URL, headers={"User-Agent": "BUA-Installer"})
-        with urllib.request.urlopen(req, timeout=10) as response:
+        with urllib.request.urlopen(req, timeout=network_timeout(10)) as response:
             service_content = response.read()
 
         # Write service file
@@ -5270,7 +7925,10 @@ def setup_custom_service_handler():
 
 if __name__ == "__main__":
     try:
-        # Run live update block before anything else
+        with trace_span("boot"):
+            boot()
+
+        # Start live update tasks in the background
         live_update_block()
 
         play_splash_and_load()
@@ -5278,6 +7936,10 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         pass
     finally:
+        HISTORY.flush()
+        SETTINGS.flush()
+        STATE.close()
+        write_trace()
         # Check if killall emulationstation was deferred during installation
         # If so, run it now instead of just refreshing
         try:
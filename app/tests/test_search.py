@@ -0,0 +1,50 @@
+"""Ranking checks for the catalog search (run with: python -m pytest app/tests)."""
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+@pytest.fixture(scope="module", params=["bua_installerx86", "bua_installerarm64"])
+def installer(request):
+    module = importlib.import_module(request.param)
+    module.index_catalog()
+    return module
+
+
+@pytest.fixture(scope="module")
+def x86():
+    module = importlib.import_module("bua_installerx86")
+    module.index_catalog()
+    return module
+
+
+def test_whole_word_in_description_beats_typo_in_name(x86):
+    # "xbox" is a word of Greenlight's description, one edit away from "box"
+    # in Super Crate Box's name
+    results = x86.SEARCH_INDEX.search("xbox")
+    assert results[0] == "Greenlight"
+    assert results.index("Greenlight") < results.index("Super Crate Box")
+
+
+def test_word_inside_description_word_is_found(x86):
+    # Sonic Robo Blast 2 is a "fangame"
+    assert "Sonic Robo Blast 2" in x86.SEARCH_INDEX.search("game")
+
+
+def test_short_query_matches_whole_words_only(installer):
+    assert installer.SEARCH_INDEX.search("fox") == ["Firefox"]
+
+
+def test_substring_hits_match_plain_scan(installer):
+    # Every app whose name or description contains the query is still found
+    for query in ("fox", "game", "media", "tool", "ash"):
+        expected = {
+            app for app in installer.APPS
+            if query in app.lower() or query in installer.DESCRIPTIONS.get(app, "").lower()
+        }
+        assert expected <= set(installer.SEARCH_INDEX.search(query)), query
+